@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from collections import defaultdict
 import logging
 import re
-from ..utils.validators import validate_and_correct_flow
+from ..utils.validators import validate_and_correct_flows
 from ..protocols.protocol_types import COMMUNICATION_PROTOCOLS
 
 logger = logging.getLogger(__name__)
@@ -71,18 +71,21 @@ class FlowDetector:
                     flows.append(flow)
         
         # Deuxième passe : amélioration avec le contexte
-        improved_flows = []
+        candidate_flows = []
         for flow in flows:
             improved_flow = self._improve_flow_detection(flow, components_by_id)
             if improved_flow:
-                # Validation et correction
-                validation_result = validate_and_correct_flow(improved_flow, components_by_id, self.protocols)
-                
-                # Log des avertissements
-                for warning in validation_result.warnings:
-                    logger.warning(f"Flux {improved_flow.get('id', 'unknown')}: {warning}")
-                
-                improved_flows.append(validation_result.corrected_data)
+                candidate_flows.append(improved_flow)
+        
+        # Validation et correction, en une série
+        improved_flows = []
+        validation_results = validate_and_correct_flows(candidate_flows, components_by_id, self.protocols)
+        for improved_flow, validation_result in zip(candidate_flows, validation_results):
+            # Log des avertissements
+            for warning in validation_result.warnings:
+                logger.warning(f"Flux {improved_flow.get('id', 'unknown')}: {warning}")
+            
+            improved_flows.append(validation_result.corrected_data)
         
         return improved_flows
     
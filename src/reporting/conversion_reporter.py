@@ -77,7 +77,7 @@ class ConversionReporter:
     def _setup_logging(self) -> None:
         """Configure le logging structuré."""
         # Création du handler pour les fichiers
-        log_file = self.output_dir / f"conversion_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        log_file = self.output_dir / f"conversion_{time.strftime('%Y%m%d_%H%M%S')}.log"
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.INFO)
         
@@ -170,8 +170,11 @@ class ConversionReporter:
         Returns:
             str: Chemin du fichier de rapport généré
         """
+        # Horodatage unique pour le contenu et le nom du fichier
+        now = datetime.now()
+        
         report_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "global_stats": {
                 "total_files": self.global_stats.total_files,
                 "successful_conversions": self.global_stats.successful_conversions,
@@ -210,7 +213,7 @@ class ConversionReporter:
         }
         
         # Génération du rapport
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         if format.lower() == "yaml":
             report_file = self.output_dir / f"conversion_report_{timestamp}.yaml"
             with open(report_file, 'w', encoding='utf-8') as f:
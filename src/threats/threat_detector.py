@@ -2,17 +2,27 @@
 Module de détection des menaces de sécurité.
 """
 
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
 import logging
 import re
+import sys
+from bisect import bisect_right
 from ..utils.validators import validate_and_correct_threat
 from ..components.component_types import COMPONENT_TYPES
 from ..flows.flow_detector import FlowDetector
 
 logger = logging.getLogger(__name__)
 
+# Seuils de score (croissants) et priorités correspondantes
+_PRIORITY_THRESHOLDS = (0.4, 0.6, 0.8)
+_PRIORITY_NAMES = tuple(sys.intern(name) for name in ('low', 'medium', 'high', 'critical'))
+
+def _intern_id(value: Optional[str]) -> Optional[str]:
+    """Interne un identifiant de composant ou de flux s'il s'agit d'une chaîne."""
+    return sys.intern(value) if type(value) is str else value
+
 @dataclass
 class ThreatContext:
     """Contexte de détection pour les menaces."""
@@ -108,22 +118,36 @@ class ThreatDetector:
         # Patterns pour les menaces composites
         self.composite_threat_patterns = {
             'authentication_bypass': {
-                'required_threats': {'authentication', 'authorization'},
-                'optional_threats': {'injection', 'data_exposure'},
+                'required_threats': frozenset({'authentication', 'authorization'}),
+                'optional_threats': frozenset({'injection', 'data_exposure'}),
                 'risk_multiplier': 1.5
             },
             'data_breach': {
-                'required_threats': {'data_exposure', 'authorization'},
-                'optional_threats': {'authentication', 'injection'},
+                'required_threats': frozenset({'data_exposure', 'authorization'}),
+                'optional_threats': frozenset({'authentication', 'injection'}),
                 'risk_multiplier': 1.8
             },
             'service_compromise': {
-                'required_threats': {'injection', 'dos'},
-                'optional_threats': {'authentication', 'authorization'},
+                'required_threats': frozenset({'injection', 'dos'}),
+                'optional_threats': frozenset({'authentication', 'authorization'}),
                 'risk_multiplier': 1.6
             }
         }
         
+        # Nombre minimal de types distincts pour former une menace composite
+        self._min_composite_types = min(
+            len(info['required_threats']) for info in self.composite_threat_patterns.values()
+        )
+        
+        # Types de menaces internés pour des regroupements/comparaisons par identité
+        self._interned_types = {threat_type: sys.intern(threat_type) for threat_type in self.threat_patterns}
+        
+        # Score de base par type de menace (somme des facteurs de risque)
+        self._base_score_by_type = {
+            threat_type: sum(info['risk_factors'].values())
+            for threat_type, info in self.threat_patterns.items()
+        }
+        
         # Niveaux de priorité
         self.priority_levels = {
             'critical': 1,
@@ -135,8 +159,8 @@ class ThreatDetector:
     def detect_threats(self, cells: List[Dict], components: List[Dict], flows: List[Dict]) -> List[Dict]:
         """Détecte les menaces de sécurité dans les cellules."""
         threats = []
-        components_by_id = {comp.get('id'): comp for comp in components}
-        flows_by_id = {flow.get('id'): flow for flow in flows}
+        components_by_id = {_intern_id(comp.get('id')): comp for comp in components}
+        flows_by_id = {_intern_id(flow.get('id')): flow for flow in flows}
         
         # Première passe : détection basique
         for cell in cells:
@@ -145,6 +169,9 @@ class ThreatDetector:
                 if threat:
                     threats.append(threat)
         
+        if not threats:
+            return []
+        
         # Deuxième passe : amélioration avec le contexte
         improved_threats = []
         for threat in threats:
@@ -159,6 +186,9 @@ class ThreatDetector:
                 
                 improved_threats.append(validation_result.corrected_data)
         
+        if not improved_threats:
+            return []
+        
         # Détection des menaces composites
         composite_threats = self._detect_composite_threats(improved_threats)
         
@@ -216,7 +246,7 @@ class ThreatDetector:
         
         for threat_type, info in self.threat_patterns.items():
             if any(bool(re.search(pattern, value)) for pattern in info['patterns']):
-                return threat_type
+                return self._interned_types[threat_type]
         
         return None
     
@@ -262,13 +292,8 @@ class ThreatDetector:
     
     def _calculate_initial_risk_score(self, threat_type: str, affected_components: Set[str], affected_flows: Set[str]) -> float:
         """Calcule le score de risque initial pour une menace."""
-        base_score = 0.0
-        threat_info = self.threat_patterns.get(threat_type, {})
-        
         # Score de base basé sur le type de menace
-        risk_factors = threat_info.get('risk_factors', {})
-        for factor, weight in risk_factors.items():
-            base_score += weight
+        base_score = self._base_score_by_type.get(threat_type, 0.0)
         
         # Ajustement basé sur le nombre de composants affectés
         component_factor = min(len(affected_components) / 5, 1.0)
@@ -282,14 +307,7 @@ class ThreatDetector:
     
     def _determine_priority(self, risk_score: float) -> str:
         """Détermine le niveau de priorité basé sur le score de risque."""
-        if risk_score >= 0.8:
-            return 'critical'
-        elif risk_score >= 0.6:
-            return 'high'
-        elif risk_score >= 0.4:
-            return 'medium'
-        else:
-            return 'low'
+        return _PRIORITY_NAMES[bisect_right(_PRIORITY_THRESHOLDS, risk_score)]
     
     def _improve_threat_detection(self, threat: Dict, components_by_id: Dict[str, Dict], flows_by_id: Dict[str, Dict]) -> Optional[Dict]:
         """Améliore la détection d'une menace en utilisant le contexte."""
@@ -325,12 +343,19 @@ class ThreatDetector:
     
     def _detect_composite_threats(self, threats: List[Dict]) -> List[Dict]:
         """Détecte les menaces composites."""
-        composite_threats = []
+        composite_threats: List[Dict[str, Any]] = []
         threats_by_type = defaultdict(list)
+        available_types = set()
         
         # Regroupement des menaces par type
         for threat in threats:
-            threats_by_type[threat.get('type', '')].append(threat)
+            threat_type = threat.get('type', '')
+            threats_by_type[threat_type].append(threat)
+            available_types.add(threat_type)
+        
+        # Pas assez de types distincts pour une menace composite
+        if len(available_types) < self._min_composite_types:
+            return composite_threats
         
         # Détection des menaces composites
         for comp_type, pattern_info in self.composite_threat_patterns.items():
@@ -338,7 +363,7 @@ class ThreatDetector:
             optional_threats = pattern_info['optional_threats']
             
             # Vérification des menaces requises
-            if not all(threat_type in threats_by_type for threat_type in required_threats):
+            if not required_threats.issubset(available_types):
                 continue
             
             # Création de la menace composite
@@ -355,7 +380,7 @@ class ThreatDetector:
         
         return composite_threats
     
-    def _create_composite_threat(self, comp_type: str, required_threats: Set[str], optional_threats: Set[str],
+    def _create_composite_threat(self, comp_type: str, required_threats: FrozenSet[str], optional_threats: FrozenSet[str],
                                threats_by_type: Dict[str, List[Dict]], risk_multiplier: float) -> Optional[Dict]:
         """Crée une menace composite à partir de menaces existantes."""
         # Collecte des composants et flux affectés
@@ -395,38 +420,46 @@ class ThreatDetector:
     
     def _calculate_risk_scores(self, threats: List[Dict]) -> List[Dict]:
         """Calcule les scores de risque finaux et priorise les menaces."""
+        # Totaux du contexte global, invariants pendant ce calcul
+        total_components = len(self.threat_context.affected_components)
+        total_flows = len(self.threat_context.affected_flows)
+        
+        has_context = total_components > 0 or total_flows > 0
+        
         # Calcul des scores de risque finaux
         for threat in threats:
             # Ajustement basé sur le contexte global
-            context_factor = self._calculate_context_factor(threat)
-            threat['risk_score'] = min(threat.get('risk_score', 0.0) * context_factor, 1.0)
+            if has_context:
+                context_factor = self._calculate_context_factor(threat, total_components, total_flows)
+                threat['risk_score'] = min(threat.get('risk_score', 0.0) * context_factor, 1.0)
+            else:
+                threat['risk_score'] = min(threat.get('risk_score', 0.0), 1.0)
             
             # Mise à jour de la priorité
             threat['priority'] = self._determine_priority(threat['risk_score'])
         
         # Tri des menaces par priorité et score de risque
+        priority_rank = self.priority_levels.get
         return sorted(
             threats,
             key=lambda t: (
-                self.priority_levels.get(t.get('priority', 'low'), 4),
+                priority_rank(t.get('priority', 'low'), 4),
                 -t.get('risk_score', 0.0)
             )
         )
     
-    def _calculate_context_factor(self, threat: Dict) -> float:
+    def _calculate_context_factor(self, threat: Dict, total_components: int, total_flows: int) -> float:
         """Calcule un facteur d'ajustement basé sur le contexte global."""
         factor = 1.0
         
         # Ajustement basé sur le nombre total de composants affectés
-        total_components = len(self.threat_context.affected_components)
         if total_components > 0:
             affected_ratio = len(threat.get('affected_components', [])) / total_components
             factor *= (1 + affected_ratio)
         
         # Ajustement basé sur le nombre total de flux affectés
-        total_flows = len(self.threat_context.affected_flows)
         if total_flows > 0:
             affected_ratio = len(threat.get('affected_flows', [])) / total_flows
             factor *= (1 + affected_ratio)
         
-        return factor 
\ No newline at end of file
+        return factor
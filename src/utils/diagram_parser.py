@@ -2,10 +2,13 @@
 Module pour parser différents types de diagrammes XML et les convertir en format Threagile.
 """
 
-import xml.etree.ElementTree as ET
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, FrozenSet, List, NamedTuple, Optional, Set, Tuple, Union
 import re
 import logging
+import functools
+from collections import defaultdict
+from io import BytesIO
+from itertools import chain
 from .threats_database import (
     KNOWN_THREATS,
     RISK_FACTORS,
@@ -15,6 +18,20 @@ from .threats_database import (
     get_threats_by_risk_level
 )
 
+try:
+    from lxml import etree as ET
+    _LXML_AVAILABLE = True
+    _ITERPARSE_OPTIONS: Dict[str, Any] = {'huge_tree': True, 'remove_blank_text': True}
+except ImportError:  # pragma: no cover - repli sur la bibliothèque standard
+    import xml.etree.ElementTree as ET
+    _LXML_AVAILABLE = False
+    _ITERPARSE_OPTIONS = {}
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - repli sur la recherche par sous-chaînes
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 # Facteurs de risque et leurs poids
@@ -66,86 +83,107 @@ RISK_LEVELS = {
     'low': 4         # Score >= 4
 }
 
+# Niveaux de risque triés par seuil décroissant
+_RISK_LEVELS_SORTED = tuple(sorted(RISK_LEVELS.items(), key=lambda x: x[1], reverse=True))
+
+
+class ComponentTypeAttrs(NamedTuple):
+    """Attributs de sécurité par défaut d'un type de composant."""
+    styles: Tuple[str, ...]
+    authentication: str
+    authorization: str
+    data_sensitivity: str
+
+
+class ProtocolAttrs(NamedTuple):
+    """Caractéristiques de sécurité d'un protocole de communication."""
+    security: str
+    encryption: bool
+    authentication: str
+    authorization: str
+    data_sensitivity: str
+
+
 # Types de composants et leurs attributs
-COMPONENT_TYPES = {
-    'web-application': {
-        'styles': ['web', 'browser', 'client', 'frontend', 'ui', 'interface'],
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    },
-    'api': {
-        'styles': ['api', 'rest', 'graphql', 'endpoint', 'service'],
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    },
-    'database': {
-        'styles': ['database', 'db', 'sql', 'nosql', 'postgres', 'mysql', 'mongodb', 'oracle'],
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'confidential'
-    },
-    'cloud-service': {
-        'styles': ['cloud', 'aws', 'azure', 'gcp', 's3', 'lambda', 'function'],
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    },
-    'serverless': {
-        'styles': ['lambda', 'function', 'serverless', 'faas'],
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    },
-    'microservice': {
-        'styles': ['service', 'microservice', 'ms', 'backend'],
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    },
-    'load-balancer': {
-        'styles': ['load-balancer', 'lb', 'haproxy', 'nginx'],
-        'authentication': 'none',
-        'authorization': 'none',
-        'data_sensitivity': 'public'
-    },
-    'cache': {
-        'styles': ['cache', 'redis', 'memcached', 'memory'],
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    },
-    'message-queue': {
-        'styles': ['queue', 'kafka', 'rabbitmq', 'mq', 'message'],
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    },
-    'process': {
-        'styles': ['process', 'application', 'app', 'program'],
-        'authentication': 'none',
-        'authorization': 'none',
-        'data_sensitivity': 'public'
-    },
-    'gateway': {
-        'styles': ['gateway', 'api-gateway', 'proxy'],
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    },
-    'cdn': {
-        'styles': ['cdn', 'content-delivery', 'edge'],
-        'authentication': 'none',
-        'authorization': 'none',
-        'data_sensitivity': 'public'
-    },
-    'monitoring': {
-        'styles': ['monitoring', 'metrics', 'logging', 'prometheus', 'grafana'],
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    }
+COMPONENT_TYPES: Dict[str, ComponentTypeAttrs] = {
+    'web-application': ComponentTypeAttrs(
+        styles=('web', 'browser', 'client', 'frontend', 'ui', 'interface'),
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    ),
+    'api': ComponentTypeAttrs(
+        styles=('api', 'rest', 'graphql', 'endpoint', 'service'),
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    ),
+    'database': ComponentTypeAttrs(
+        styles=('database', 'db', 'sql', 'nosql', 'postgres', 'mysql', 'mongodb', 'oracle'),
+        authentication='required',
+        authorization='required',
+        data_sensitivity='confidential'
+    ),
+    'cloud-service': ComponentTypeAttrs(
+        styles=('cloud', 'aws', 'azure', 'gcp', 's3', 'lambda', 'function'),
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    ),
+    'serverless': ComponentTypeAttrs(
+        styles=('lambda', 'function', 'serverless', 'faas'),
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    ),
+    'microservice': ComponentTypeAttrs(
+        styles=('service', 'microservice', 'ms', 'backend'),
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    ),
+    'load-balancer': ComponentTypeAttrs(
+        styles=('load-balancer', 'lb', 'haproxy', 'nginx'),
+        authentication='none',
+        authorization='none',
+        data_sensitivity='public'
+    ),
+    'cache': ComponentTypeAttrs(
+        styles=('cache', 'redis', 'memcached', 'memory'),
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    ),
+    'message-queue': ComponentTypeAttrs(
+        styles=('queue', 'kafka', 'rabbitmq', 'mq', 'message'),
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    ),
+    'process': ComponentTypeAttrs(
+        styles=('process', 'application', 'app', 'program'),
+        authentication='none',
+        authorization='none',
+        data_sensitivity='public'
+    ),
+    'gateway': ComponentTypeAttrs(
+        styles=('gateway', 'api-gateway', 'proxy'),
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    ),
+    'cdn': ComponentTypeAttrs(
+        styles=('cdn', 'content-delivery', 'edge'),
+        authentication='none',
+        authorization='none',
+        data_sensitivity='public'
+    ),
+    'monitoring': ComponentTypeAttrs(
+        styles=('monitoring', 'metrics', 'logging', 'prometheus', 'grafana'),
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    )
 }
 
 # Types de données et leurs sensibilités
@@ -173,93 +211,524 @@ DATA_TYPES = {
 }
 
 # Protocoles de communication et leurs caractéristiques
-COMMUNICATION_PROTOCOLS = {
-    'http': {
-        'security': 'low',
-        'encryption': False,
-        'authentication': 'none',
-        'authorization': 'none',
-        'data_sensitivity': 'public'
-    },
-    'https': {
-        'security': 'high',
-        'encryption': True,
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    },
-    'ws': {
-        'security': 'low',
-        'encryption': False,
-        'authentication': 'none',
-        'authorization': 'none',
-        'data_sensitivity': 'public'
-    },
-    'wss': {
-        'security': 'high',
-        'encryption': True,
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    },
-    'grpc': {
-        'security': 'medium',
-        'encryption': True,
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    },
-    'tcp': {
-        'security': 'low',
-        'encryption': False,
-        'authentication': 'none',
-        'authorization': 'none',
-        'data_sensitivity': 'public'
-    },
-    'udp': {
-        'security': 'low',
-        'encryption': False,
-        'authentication': 'none',
-        'authorization': 'none',
-        'data_sensitivity': 'public'
-    },
-    'mqtt': {
-        'security': 'medium',
-        'encryption': True,
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    },
-    'amqp': {
-        'security': 'high',
-        'encryption': True,
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    },
-    'kafka': {
-        'security': 'high',
-        'encryption': True,
-        'authentication': 'required',
-        'authorization': 'required',
-        'data_sensitivity': 'internal'
-    }
+COMMUNICATION_PROTOCOLS: Dict[str, ProtocolAttrs] = {
+    'http': ProtocolAttrs(
+        security='low',
+        encryption=False,
+        authentication='none',
+        authorization='none',
+        data_sensitivity='public'
+    ),
+    'https': ProtocolAttrs(
+        security='high',
+        encryption=True,
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    ),
+    'ws': ProtocolAttrs(
+        security='low',
+        encryption=False,
+        authentication='none',
+        authorization='none',
+        data_sensitivity='public'
+    ),
+    'wss': ProtocolAttrs(
+        security='high',
+        encryption=True,
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    ),
+    'grpc': ProtocolAttrs(
+        security='medium',
+        encryption=True,
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    ),
+    'tcp': ProtocolAttrs(
+        security='low',
+        encryption=False,
+        authentication='none',
+        authorization='none',
+        data_sensitivity='public'
+    ),
+    'udp': ProtocolAttrs(
+        security='low',
+        encryption=False,
+        authentication='none',
+        authorization='none',
+        data_sensitivity='public'
+    ),
+    'mqtt': ProtocolAttrs(
+        security='medium',
+        encryption=True,
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    ),
+    'amqp': ProtocolAttrs(
+        security='high',
+        encryption=True,
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    ),
+    'kafka': ProtocolAttrs(
+        security='high',
+        encryption=True,
+        authentication='required',
+        authorization='required',
+        data_sensitivity='internal'
+    )
+}
+
+# Index aplati (mot-clé, type de composant), dans l'ordre de COMPONENT_TYPES
+_STYLE_INDEX = tuple(
+    (keyword, comp_type)
+    for comp_type, attrs in COMPONENT_TYPES.items()
+    for keyword in attrs.styles
+)
+
+# Mots-clés de style par type de composant
+_STYLE_KEYWORDS_BY_TYPE = {
+    comp_type: frozenset(attrs.styles)
+    for comp_type, attrs in COMPONENT_TYPES.items()
 }
 
+
+def _build_style_keyword_rank() -> Dict[str, int]:
+    """
+    Associe chaque mot-clé de style à son rang de première apparition dans _STYLE_INDEX.
+    
+    Returns:
+        Dictionnaire {mot-clé: rang}
+    """
+    ranks: Dict[str, int] = {}
+    for rank, (keyword, _) in enumerate(_STYLE_INDEX):
+        ranks.setdefault(keyword, rank)
+    return ranks
+
+
+_STYLE_KEYWORD_RANK = _build_style_keyword_rank()
+
+# Séparateurs de la syntaxe de style DrawIO (clé=valeur;clé=valeur)
+_STYLE_TOKEN_SPLIT = re.compile(r'[;=,\s]+')
+
+# Mots-clés signalant des données métier
+BUSINESS_DATA_KEYWORDS = ['order', 'transaction', 'invoice', 'payment', 'business']
+
+
+def _build_keyword_automaton() -> Optional[Any]:
+    """
+    Construit un automate Aho-Corasick regroupant tous les mots-clés de classification.
+    
+    Chaque mot-clé est associé à un tuple d'entrées (catégorie, nom, rang), le rang
+    reflétant l'ordre de déclaration dans la table d'origine.
+    
+    Returns:
+        Automate prêt à l'emploi, ou None si pyahocorasick n'est pas installé
+    """
+    if ahocorasick is None:
+        return None
+    
+    entries: Dict[str, List[Tuple[str, str, int]]] = {}
+    for rank, (comp_type, attrs) in enumerate(COMPONENT_TYPES.items()):
+        for keyword in attrs.styles:
+            entries.setdefault(keyword, []).append(('comp_type', comp_type, rank))
+    for rank, protocol in enumerate(COMMUNICATION_PROTOCOLS):
+        entries.setdefault(protocol, []).append(('protocol', protocol, rank))
+    for rank, (data_type, info) in enumerate(DATA_TYPES.items()):
+        for example in info['examples']:
+            entries.setdefault(example, []).append(('data', data_type, rank))
+    for keyword in BUSINESS_DATA_KEYWORDS:
+        entries.setdefault(keyword, []).append(('business', keyword, 0))
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, payload in entries.items():
+        automaton.add_word(keyword, tuple(payload))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _scan_keywords(style_lower: str, value_lower: str) -> Tuple[Dict[str, Dict[str, int]], Dict[str, Dict[str, int]]]:
+    """
+    Recherche en une passe tous les mots-clés présents dans le style et la valeur.
+    
+    Args:
+        style_lower: Style en minuscules
+        value_lower: Valeur en minuscules
+        
+    Returns:
+        Tuple (correspondances du style, correspondances de la valeur), chacune
+        associant une catégorie à un dictionnaire {nom: rang}
+    """
+    style_hits: Dict[str, Dict[str, int]] = {}
+    value_hits: Dict[str, Dict[str, int]] = {}
+    automaton = _KEYWORD_AUTOMATON
+    if automaton is None:
+        # Sans pyahocorasick, les appelants utilisent la recherche par sous-chaînes
+        return style_hits, value_hits
+    split = len(style_lower)
+    for end, payload in automaton.iter(style_lower + '\x00' + value_lower):
+        hits = style_hits if end < split else value_hits
+        for kind, name, rank in payload:
+            hits.setdefault(kind, {})[name] = rank
+    return style_hits, value_hits
+
+
+def _first_ranked(matches: Optional[Dict[str, int]]) -> Optional[str]:
+    """Retourne le nom de plus petit rang parmi les correspondances."""
+    if not matches:
+        return None
+    return min(matches, key=matches.__getitem__)
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_component(style_lower: str, value_lower: str) -> str:
+    """
+    Détermine le type de composant à partir du style puis de la valeur.
+    
+    Args:
+        style_lower: Style du composant en minuscules
+        value_lower: Valeur du composant en minuscules
+        
+    Returns:
+        Type de composant ('process' par défaut)
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        style_hits, value_hits = _scan_keywords(style_lower, value_lower)
+        return (
+            _first_ranked(style_hits.get('comp_type'))
+            or _first_ranked(value_hits.get('comp_type'))
+            or 'process'
+        )
+    
+    # Recherche dans les styles, puis dans la valeur
+    return (
+        _first_style_keyword_type(style_lower)
+        or _first_style_keyword_type(value_lower)
+        or 'process'
+    )
+
+
+def _first_style_keyword_type(text: str) -> Optional[str]:
+    """
+    Retourne le type associé au premier mot-clé de _STYLE_INDEX contenu dans le texte.
+    
+    Les jetons du texte présents tels quels parmi les mots-clés bornent la
+    recherche : seuls les mots-clés de rang inférieur restent à tester par
+    sous-chaîne.
+    
+    Args:
+        text: Texte en minuscules
+        
+    Returns:
+        Type de composant, ou None si aucun mot-clé n'est trouvé
+    """
+    token_ranks = [
+        _STYLE_KEYWORD_RANK[token]
+        for token in _STYLE_TOKEN_SPLIT.split(text)
+        if token in _STYLE_KEYWORD_RANK
+    ]
+    bound = min(token_ranks) if token_ranks else len(_STYLE_INDEX)
+    for keyword, comp_type in _STYLE_INDEX[:bound]:
+        if keyword in text:
+            return comp_type
+    return _STYLE_INDEX[bound][1] if token_ranks else None
+
+
+@functools.lru_cache(maxsize=4096)
+def _component_tags(style_lower: str, value_lower: str) -> FrozenSet[str]:
+    """
+    Calcule les tags d'un composant à partir de son style et de sa valeur.
+    
+    Args:
+        style_lower: Style du composant en minuscules
+        value_lower: Valeur du composant en minuscules
+        
+    Returns:
+        Ensemble des tags
+    """
+    tags: Set[str] = set()
+    # Tags basés sur le style
+    if _KEYWORD_AUTOMATON is not None:
+        style_hits, _ = _scan_keywords(style_lower, '')
+        tags.update(style_hits.get('comp_type', ()))
+    else:
+        tokens = frozenset(_STYLE_TOKEN_SPLIT.split(style_lower))
+        tags.update(
+            comp_type
+            for comp_type, keywords in _STYLE_KEYWORDS_BY_TYPE.items()
+            if not keywords.isdisjoint(tokens)
+            or any(keyword in style_lower for keyword in keywords)
+        )
+            
+    # Tags basés sur la valeur
+    if 'cloud' in value_lower:
+        tags.add('cloud')
+    if 'api' in value_lower:
+        tags.add('api')
+    if 'db' in value_lower or 'database' in value_lower:
+        tags.add('database')
+        
+    return frozenset(tags)
+
+
+@functools.lru_cache(maxsize=4096)
+def _match_data_types(value_lower: str) -> Tuple[bool, FrozenSet[str]]:
+    """
+    Recherche les types de données évoqués dans une valeur.
+    
+    Args:
+        value_lower: Valeur du composant en minuscules
+        
+    Returns:
+        Tuple (présence de données métier, types de DATA_TYPES détectés)
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        _, value_hits = _scan_keywords('', value_lower)
+        return 'business' in value_hits, frozenset(value_hits.get('data', ()))
+    
+    has_business_data = any(word in value_lower for word in BUSINESS_DATA_KEYWORDS)
+    matched_data_types = frozenset(
+        data_type
+        for data_type, info in DATA_TYPES.items()
+        if any(example in value_lower for example in info['examples'])
+    )
+    return has_business_data, matched_data_types
+
+
+@functools.lru_cache(maxsize=4096)
+def _match_protocol(style_lower: str, value_lower: str) -> Optional[str]:
+    """
+    Recherche un protocole nommé explicitement dans le style ou la valeur d'un flux.
+    
+    Args:
+        style_lower: Style du flux en minuscules
+        value_lower: Valeur du flux en minuscules
+        
+    Returns:
+        Premier protocole de COMMUNICATION_PROTOCOLS trouvé, ou None
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        style_hits, value_hits = _scan_keywords(style_lower, value_lower)
+        return _first_ranked({**style_hits.get('protocol', {}), **value_hits.get('protocol', {})})
+    
+    for protocol in COMMUNICATION_PROTOCOLS:
+        if protocol in style_lower or protocol in value_lower:
+            return protocol
+    return None
+
+
+# Protocoles déduits des types des composants reliés, par ordre de priorité
+_PROTOCOL_BY_COMPONENT_TYPE: Tuple[Tuple[str, str], ...] = (
+    ('database', 'tcp'),
+    ('api', 'https'),
+    ('message-queue', 'amqp'),
+    ('cache', 'tcp'),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _protocol_for_types(source_type: str, target_type: str) -> str:
+    """
+    Déduit le protocole d'un flux des types de ses composants source et cible.
+    
+    Args:
+        source_type: Type du composant source
+        target_type: Type du composant cible
+        
+    Returns:
+        Protocole de la première règle correspondante, 'http' par défaut
+    """
+    for keyword, protocol in _PROTOCOL_BY_COMPONENT_TYPE:
+        if keyword in source_type or keyword in target_type:
+            return protocol
+    return 'http'
+
+
+def _component_risk_contribution(component: Dict[str, Any]) -> int:
+    """
+    Calcule la contribution d'un composant au score de risque d'une menace.
+    
+    Args:
+        component: Composant affecté
+        
+    Returns:
+        Somme des facteurs de type, d'authentification, d'autorisation et de sensibilité
+    """
+    # Facteur de type de composant
+    score = RISK_FACTORS['component_type'].get(component.get('type', 'process'), 1)
+    
+    # Facteur d'authentification
+    score += RISK_FACTORS['authentication'].get(component.get('authentication', 'none'), 2)
+    
+    # Facteur d'autorisation
+    score += RISK_FACTORS['authorization'].get(component.get('authorization', 'none'), 2)
+    
+    # Facteur de sensibilité des données
+    data_assets = component.get('data_assets', [])
+    if data_assets:
+        score += max(
+            RISK_FACTORS['data_sensitivity'].get(asset.get('sensitivity', 'internal'), 2)
+            for asset in data_assets
+        )
+    
+    return score
+
+
+# Noms des menaces connues en minuscules
+_THREAT_NAME_LC = {threat_id: info['name'].lower() for threat_id, info in KNOWN_THREATS.items()}
+
+
+def _build_threat_keywords() -> Dict[str, Tuple[int, str]]:
+    """
+    Associe l'ID et le nom en minuscules de chaque menace connue à son rang et son ID.
+    
+    Un mot-clé partagé reste associé à la première menace de KNOWN_THREATS.
+    
+    Returns:
+        Dictionnaire {mot-clé: (rang, ID de la menace)}
+    """
+    keywords: Dict[str, Tuple[int, str]] = {}
+    for rank, threat_id in enumerate(KNOWN_THREATS):
+        for keyword in (threat_id, _THREAT_NAME_LC[threat_id]):
+            keywords.setdefault(keyword, (rank, threat_id))
+    return keywords
+
+
+_THREAT_KEYWORDS = _build_threat_keywords()
+
+# Alternative unique ordonnée par rang ; le lookahead signale à chaque position
+# le mot-clé de plus petit rang qui y commence, y compris en cas de chevauchement
+_THREAT_PATTERN = re.compile(
+    '(?=(' + '|'.join(
+        re.escape(keyword)
+        for keyword in sorted(_THREAT_KEYWORDS, key=lambda k: _THREAT_KEYWORDS[k][0])
+    ) + '))'
+)
+
+
+def _match_known_threat(value_lower: str) -> Optional[str]:
+    """
+    Identifie la menace connue mentionnée dans une valeur.
+    
+    Args:
+        value_lower: Valeur de la cellule en minuscules
+        
+    Returns:
+        ID de la première menace de KNOWN_THREATS dont l'ID ou le nom apparaît, ou None
+    """
+    best = None
+    for match in _THREAT_PATTERN.finditer(value_lower):
+        rank, threat_id = _THREAT_KEYWORDS[match.group(1)]
+        if best is None or rank < best[0]:
+            best = (rank, threat_id)
+            if rank == 0:
+                break
+    return best[1] if best else None
+
+
+def _cell_lower(cell: Dict[str, Any], key: str) -> str:
+    """
+    Retourne un attribut de cellule en minuscules, précalculé si disponible.
+    
+    Args:
+        cell: Cellule extraite
+        key: Attribut ('style' ou 'value')
+        
+    Returns:
+        Valeur de l'attribut en minuscules
+    """
+    lowered = cell.get(f"{key}_lc")
+    if lowered is None:
+        lowered = (cell.get(key) or '').lower()
+    return lowered
+
+
+def _build_drawio_cell(cell: Any) -> Dict[str, Any]:
+    """
+    Convertit un élément mxCell en dictionnaire indépendant du DOM.
+    
+    Args:
+        cell: Élément mxCell entièrement parsé
+        
+    Returns:
+        Données de la cellule, géométrie comprise sous forme d'attributs
+    """
+    geometry = cell.find('mxGeometry')
+    style = cell.get('style', '')
+    value = cell.get('value', '')
+    return {
+        'id': cell.get('id', ''),
+        'value': value,
+        'style': style,
+        'source': cell.get('source', ''),
+        'target': cell.get('target', ''),
+        'vertex': cell.get('vertex', ''),
+        'edge': cell.get('edge', ''),
+        'parent': cell.get('parent', ''),
+        'geometry': dict(geometry.attrib) if geometry is not None else None,
+        'style_lc': style.lower(),
+        'value_lc': value.lower()
+    }
+
+
 class DiagramParser:
     """Parser générique pour les diagrammes XML."""
 
-    def __init__(self, xml_content: str):
+    def __init__(self, xml_content: Union[str, bytes]):
         """
         Initialise le parser avec le contenu XML.
         
         Args:
             xml_content: Contenu XML du diagramme
         """
-        self.root = ET.fromstring(xml_content)
-        self.diagram_type = self._detect_diagram_type()
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode('utf-8')
+        self.root: Optional[Any] = None  # Élément racine, connu dès le premier événement
+        self.diagram_type = 'standard'
+        self._drawio_cells: List[Dict[str, Any]] = []  # Cellules DrawIO matérialisées au parsing
+        self._parse(xml_content)
         self.components = {}  # Cache des composants par ID
+        self._vertex_cells: List[Dict[str, Any]] = []  # Cellules sommets (DrawIO)
+        self._edge_cells: Optional[List[Dict[str, Any]]] = None  # Cellules arêtes (DrawIO)
+        self._edges_by_endpoint: Dict[str, List[str]] = {}  # ID -> IDs connectés par une arête
+        self._component_risk: Dict[str, int] = {}  # Contribution au risque par ID de composant
+        
+    def _parse(self, xml_content: bytes) -> None:
+        """
+        Parse le XML en flux et matérialise les cellules DrawIO au fil de l'eau.
         
+        Le type de diagramme est détecté sur l'élément racine. Chaque mxCell est
+        convertie en dictionnaire puis vidée pour libérer la mémoire du DOM.
+        
+        Args:
+            xml_content: Contenu XML du diagramme
+        """
+        for event, elem in ET.iterparse(BytesIO(xml_content), events=('start', 'end'), **_ITERPARSE_OPTIONS):
+            if self.root is None:
+                self.root = elem
+                self.diagram_type = self._detect_diagram_type()
+                continue
+            if event != 'end' or elem.tag != 'mxCell' or self.diagram_type != 'drawio':
+                continue
+            
+            # Ignorer les cellules vides ou les cellules de structure
+            cell_id = elem.get('id')
+            if cell_id and cell_id not in ('0', '1'):
+                self._drawio_cells.append(_build_drawio_cell(elem))
+            
+            elem.clear()
+            if _LXML_AVAILABLE:
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
     def _detect_diagram_type(self) -> str:
         """
         Détecte le type de diagramme basé sur la structure XML.
@@ -267,16 +736,20 @@ class DiagramParser:
         Returns:
             Type de diagramme détecté ('drawio', 'plantuml', 'mermaid', etc.)
         """
+        if self.root is None:
+            return 'standard'
+        tag = self.root.tag
+        
         # Vérification DrawIO
-        if self.root.tag == 'mxfile' or 'drawio' in self.root.tag.lower():
+        if tag == 'mxfile' or 'drawio' in tag.lower():
             return 'drawio'
             
         # Vérification PlantUML
-        if 'plantuml' in self.root.tag.lower():
+        if 'plantuml' in tag.lower():
             return 'plantuml'
             
         # Vérification Mermaid
-        if 'mermaid' in self.root.tag.lower():
+        if 'mermaid' in tag.lower():
             return 'mermaid'
             
         # Par défaut, on considère que c'est un XML standard
@@ -301,23 +774,23 @@ class DiagramParser:
     def _extract_drawio_cells(self) -> List[Dict[str, Any]]:
         """Extrait les cellules d'un diagramme DrawIO."""
         cells = []
-        for cell in self.root.findall('.//mxCell'):
-            # Ignorer les cellules vides ou les cellules de structure
-            if not cell.get('id') or cell.get('id') in ['0', '1']:
-                continue
-                
-            cell_data = {
-                'id': cell.get('id', ''),
-                'value': cell.get('value', ''),
-                'style': cell.get('style', ''),
-                'source': cell.get('source', ''),
-                'target': cell.get('target', ''),
-                'vertex': cell.get('vertex', ''),
-                'edge': cell.get('edge', ''),
-                'parent': cell.get('parent', ''),
-                'geometry': cell.find('mxGeometry')
-            }
+        vertex_cells = []
+        edge_cells = []
+        edges_by_endpoint = defaultdict(list)
+        for cell_data in self._drawio_cells:
             cells.append(cell_data)
+            if cell_data['edge'] == '1':
+                edge_cells.append(cell_data)
+                source = cell_data['source']
+                target = cell_data['target']
+                edges_by_endpoint[source].append(target)
+                if target != source:
+                    edges_by_endpoint[target].append(source)
+            elif cell_data['vertex'] == '1':
+                vertex_cells.append(cell_data)
+        self._vertex_cells = vertex_cells
+        self._edge_cells = edge_cells
+        self._edges_by_endpoint = edges_by_endpoint
         return cells
 
     def _extract_plantuml_cells(self) -> List[Dict[str, Any]]:
@@ -350,14 +823,15 @@ class DiagramParser:
         """
         components = []
         
-        for cell in cells:
-            if self.diagram_type == 'drawio':
+        if self.diagram_type == 'drawio':
+            for cell in cells:
                 if cell.get('vertex') == '1':
                     component = self._create_component_from_drawio(cell)
                     if component:
                         components.append(component)
                         self.components[cell['id']] = component
-            # Ajouter d'autres types de diagrammes ici
+                        self._component_risk[cell['id']] = _component_risk_contribution(component)
+        # Ajouter d'autres types de diagrammes ici
             
         return components
 
@@ -372,25 +846,15 @@ class DiagramParser:
         Returns:
             Type de composant
         """
-        style_lower = style.lower()
-        value_lower = value.lower()
-        
-        # Recherche dans les styles
-        for comp_type, attrs in COMPONENT_TYPES.items():
-            if any(s in style_lower for s in attrs['styles']):
-                return comp_type
-                
-        # Recherche dans la valeur
-        for comp_type, attrs in COMPONENT_TYPES.items():
-            if any(s in value_lower for s in attrs['styles']):
-                return comp_type
-                
-        return 'process'
+        return _classify_component(style.lower(), value.lower())
 
     def _extract_data_assets(self, component: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Extrait les assets de données d'un composant.
         
+        Les IDs générés sont préfixés par l'ID du composant lorsqu'il est connu,
+        afin de rester uniques d'un composant à l'autre.
+        
         Args:
             component: Composant à analyser
             
@@ -398,12 +862,14 @@ class DiagramParser:
             Liste des assets de données
         """
         data_assets = []
-        value = component.get('value', '').lower()
+        component_id = component.get('id')
+        id_prefix = f"data_{component_id}_" if component_id else "data_"
+        has_business_data, matched_data_types = _match_data_types(_cell_lower(component, 'value'))
         
         # Vérification des données métier en premier
-        if any(word in value for word in ['order', 'transaction', 'invoice', 'payment', 'business']):
+        if has_business_data:
             data_assets.append({
-                'id': f"data_{len(data_assets)}",
+                'id': f"{id_prefix}{len(data_assets)}",
                 'name': 'Business Data',
                 'description': 'Données métier',
                 'sensitivity': 'restricted'
@@ -411,9 +877,9 @@ class DiagramParser:
             
         # Puis vérification des autres types de données
         for data_type, info in DATA_TYPES.items():
-            if any(example in value for example in info['examples']):
+            if data_type in matched_data_types:
                 data_assets.append({
-                    'id': f"data_{len(data_assets)}",
+                    'id': f"{id_prefix}{len(data_assets)}",
                     'name': f"{data_type.capitalize()} Data",
                     'description': info['description'],
                     'sensitivity': info['sensitivity']
@@ -431,17 +897,18 @@ class DiagramParser:
         Returns:
             Composant créé ou None
         """
-        style = cell.get('style', '').lower()
+        style_lower = _cell_lower(cell, 'style')
         value = cell.get('value', '')
         
         if not value:
             return None
             
-        component_type = self._determine_component_type(style, value)
+        value_lower = _cell_lower(cell, 'value')
+        component_type = _classify_component(style_lower, value_lower)
         component_attrs = COMPONENT_TYPES.get(component_type, COMPONENT_TYPES['process'])
         
         # Extraction des assets de données
-        data_assets = self._extract_data_assets({'value': value})
+        data_assets = self._extract_data_assets({'id': cell['id'], 'value': value, 'value_lc': value_lower})
         
         return {
             'id': cell['id'],
@@ -449,10 +916,10 @@ class DiagramParser:
             'type': component_type,
             'usage': 'business',
             'data_assets': data_assets,
-            'authentication': component_attrs['authentication'],
-            'authorization': component_attrs['authorization'],
-            'data_sensitivity': component_attrs['data_sensitivity'],
-            'tags': self._extract_component_tags(style, value)
+            'authentication': component_attrs.authentication,
+            'authorization': component_attrs.authorization,
+            'data_sensitivity': component_attrs.data_sensitivity,
+            'tags': list(_component_tags(style_lower, value_lower))
         }
 
     def _extract_component_tags(self, style: str, value: str) -> List[str]:
@@ -466,24 +933,7 @@ class DiagramParser:
         Returns:
             Liste des tags
         """
-        tags = set()
-        style_lower = style.lower()
-        value_lower = value.lower()
-        
-        # Tags basés sur le style
-        for comp_type, attrs in COMPONENT_TYPES.items():
-            if any(s in style_lower for s in attrs['styles']):
-                tags.add(comp_type)
-                
-        # Tags basés sur la valeur
-        if 'cloud' in value_lower:
-            tags.add('cloud')
-        if 'api' in value_lower:
-            tags.add('api')
-        if 'db' in value_lower or 'database' in value_lower:
-            tags.add('database')
-            
-        return list(tags)
+        return list(_component_tags(style.lower(), value.lower()))
 
     def _identify_flows(self, cells: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -497,13 +947,13 @@ class DiagramParser:
         """
         flows = []
         
-        for cell in cells:
-            if self.diagram_type == 'drawio':
+        if self.diagram_type == 'drawio':
+            for cell in cells:
                 if cell.get('edge') == '1' and cell.get('source') and cell.get('target'):
                     flow = self._create_flow_from_drawio(cell)
                     if flow:
                         flows.append(flow)
-            # Ajouter d'autres types de diagrammes ici
+        # Ajouter d'autres types de diagrammes ici
             
         return flows
 
@@ -520,32 +970,28 @@ class DiagramParser:
         Returns:
             Protocole identifié
         """
-        style_lower = style.lower()
-        value_lower = value.lower()
+        return self._resolve_protocol(style.lower(), value.lower(), source, target)
+
+    def _resolve_protocol(self, style_lower: str, value_lower: str, source: Dict[str, Any], target: Dict[str, Any]) -> str:
+        """
+        Détermine le protocole de communication à partir du style et de la valeur en minuscules.
         
+        Args:
+            style_lower: Style du flux en minuscules
+            value_lower: Valeur du flux en minuscules
+            source: Composant source
+            target: Composant cible
+            
+        Returns:
+            Protocole identifié
+        """
         # Recherche dans le style et la valeur
-        for protocol in COMMUNICATION_PROTOCOLS:
-            if protocol in style_lower or protocol in value_lower:
-                return protocol
+        protocol = _match_protocol(style_lower, value_lower)
+        if protocol:
+            return protocol
                 
         # Détermination basée sur les composants
-        source_type = source.get('type', 'process')
-        target_type = target.get('type', 'process')
-        
-        # Priorité aux connexions base de données
-        if 'database' in source_type or 'database' in target_type:
-            return 'tcp'
-        # Puis aux connexions API
-        elif 'api' in source_type or 'api' in target_type:
-            return 'https'
-        # Puis aux connexions message queue
-        elif 'message-queue' in source_type or 'message-queue' in target_type:
-            return 'amqp'
-        # Puis aux connexions cache
-        elif 'cache' in source_type or 'cache' in target_type:
-            return 'tcp'
-            
-        return 'http'
+        return _protocol_for_types(source.get('type', 'process'), target.get('type', 'process'))
 
     def _create_flow_from_drawio(self, cell: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -569,21 +1015,19 @@ class DiagramParser:
         if not source or not target:
             return None
             
-        style = cell.get('style', '').lower()
         value = cell.get('value', '')
         
-        protocol = self._determine_protocol(style, value, source, target)
+        protocol = self._resolve_protocol(_cell_lower(cell, 'style'), _cell_lower(cell, 'value'), source, target)
         protocol_info = COMMUNICATION_PROTOCOLS.get(protocol, COMMUNICATION_PROTOCOLS['http'])
         
-        # Détermination des données échangées
-        data_assets = []
-        if source.get('data_assets'):
-            data_assets.extend(source['data_assets'])
-        if target.get('data_assets'):
-            data_assets.extend(target['data_assets'])
-            
-        # Déduplication des assets
-        unique_assets = {asset['id']: asset for asset in data_assets}.values()
+        # Détermination des données échangées, dédupliquées par ID
+        seen_ids = set()
+        unique_assets = []
+        for asset in chain(source.get('data_assets') or (), target.get('data_assets') or ()):
+            asset_id = asset['id']
+            if asset_id not in seen_ids:
+                seen_ids.add(asset_id)
+                unique_assets.append(asset)
         
         return {
             'id': f"flow_{cell['id']}",
@@ -591,12 +1035,12 @@ class DiagramParser:
             'source': source_id,
             'target': target_id,
             'protocol': protocol,
-            'authentication': protocol_info['authentication'],
-            'authorization': protocol_info['authorization'],
-            'encryption': protocol_info['encryption'],
-            'security_level': protocol_info['security'],
-            'data_sensitivity': protocol_info['data_sensitivity'],
-            'data_assets': list(unique_assets)
+            'authentication': protocol_info.authentication,
+            'authorization': protocol_info.authorization,
+            'encryption': protocol_info.encryption,
+            'security_level': protocol_info.security,
+            'data_sensitivity': protocol_info.data_sensitivity,
+            'data_assets': unique_assets
         }
 
     def _calculate_risk_score(self, threat: Dict[str, Any], affected_components: List[Dict[str, Any]]) -> int:
@@ -611,29 +1055,15 @@ class DiagramParser:
             Score de risque calculé
         """
         threat_info = get_threat_info(threat.get('id', ''))
-        score = threat_info.get('base_risk', 2)
+        score: int = threat_info.get('base_risk', 2)
         
         for component in affected_components:
-            # Facteur de type de composant
-            component_type = component.get('type', 'process')
-            score += RISK_FACTORS['component_type'].get(component_type, 1)
-            
-            # Facteur d'authentification
-            auth = component.get('authentication', 'none')
-            score += RISK_FACTORS['authentication'].get(auth, 2)
-            
-            # Facteur d'autorisation
-            authz = component.get('authorization', 'none')
-            score += RISK_FACTORS['authorization'].get(authz, 2)
-            
-            # Facteur de sensibilité des données
-            data_assets = component.get('data_assets', [])
-            if data_assets:
-                max_sensitivity = max(
-                    RISK_FACTORS['data_sensitivity'].get(asset.get('sensitivity', 'internal'), 2)
-                    for asset in data_assets
-                )
-                score += max_sensitivity
+            # Contribution précalculée lors de l'identification du composant
+            component_id = component.get('id')
+            if component_id is not None and self.components.get(component_id) is component:
+                score += self._component_risk[component_id]
+            else:
+                score += _component_risk_contribution(component)
         
         return score
 
@@ -647,7 +1077,7 @@ class DiagramParser:
         Returns:
             Niveau de risque ('critical', 'high', 'medium', 'low')
         """
-        for level, threshold in sorted(RISK_LEVELS.items(), key=lambda x: x[1], reverse=True):
+        for level, threshold in _RISK_LEVELS_SORTED:
             if score >= threshold:
                 return level
         return 'low'
@@ -664,39 +1094,39 @@ class DiagramParser:
         """
         threats = []
         
-        for cell in cells:
-            if self.diagram_type == 'drawio':
-                style = cell.get('style', '').lower()
-                value = cell.get('value', '').lower()
+        if self.diagram_type == 'drawio':
+            for cell in cells:
+                style = _cell_lower(cell, 'style')
+                value = _cell_lower(cell, 'value')
                 
                 # Détection des menaces connues
-                for threat_id, threat_info in KNOWN_THREATS.items():
-                    if threat_id in value or threat_info['name'].lower() in value:
-                        affected_assets = self._identify_affected_assets(cell)
-                        affected_components = [self.components[asset_id] for asset_id in affected_assets if asset_id in self.components]
-                        
-                        # Calcul du score de risque
-                        risk_score = self._calculate_risk_score(
-                            {'id': threat_id, **threat_info},
-                            affected_components
-                        )
-                        
-                        # Détermination du niveau de risque
-                        risk_level = self._determine_risk_level(risk_score)
-                        
-                        threat = {
-                            'id': f"threat_{cell['id']}",
-                            'name': threat_info['name'],
-                            'description': threat_info.get('description', f"Identified threat: {cell.get('value', '')}"),
-                            'risk_level': risk_level,
-                            'risk_score': risk_score,
-                            'affected_assets': affected_assets,
-                            'mitigation': threat_info.get('mitigation', []),
-                            'owasp_category': threat_info.get('owasp_category', ''),
-                            'cwe': threat_info.get('cwe', '')
-                        }
-                        threats.append(threat)
-                        break
+                threat_id = _match_known_threat(value)
+                if threat_id is not None:
+                    threat_info = KNOWN_THREATS[threat_id]
+                    affected_assets = self._identify_affected_assets(cell)
+                    affected_components = [self.components[asset_id] for asset_id in affected_assets if asset_id in self.components]
+                    
+                    # Calcul du score de risque
+                    risk_score = self._calculate_risk_score(
+                        {'id': threat_id, **threat_info},
+                        affected_components
+                    )
+                    
+                    # Détermination du niveau de risque
+                    risk_level = self._determine_risk_level(risk_score)
+                    
+                    threat = {
+                        'id': f"threat_{cell['id']}",
+                        'name': threat_info['name'],
+                        'description': threat_info.get('description', f"Identified threat: {cell.get('value', '')}"),
+                        'risk_level': risk_level,
+                        'risk_score': risk_score,
+                        'affected_assets': affected_assets,
+                        'mitigation': threat_info.get('mitigation', []),
+                        'owasp_category': threat_info.get('owasp_category', ''),
+                        'cwe': threat_info.get('cwe', '')
+                    }
+                    threats.append(threat)
                 
                 # Détection des menaces basée sur le style
                 if 'cloud' in style or 'threat' in value or 'attack' in value:
@@ -737,20 +1167,15 @@ class DiagramParser:
         Returns:
             Liste des IDs des assets affectés
         """
-        affected_assets = []
+        if self._edge_cells is None:
+            self._extract_cells()
         
-        # Recherche des composants connectés à la menace
-        for cell in self.root.findall('.//mxCell'):
-            if cell.get('edge') == '1':
-                source = cell.get('source')
-                target = cell.get('target')
-                
-                if source == threat_cell['id'] and target in self.components:
-                    affected_assets.append(target)
-                elif target == threat_cell['id'] and source in self.components:
-                    affected_assets.append(source)
-                    
-        return affected_assets
+        # Composants connectés à la menace par une arête
+        return [
+            asset_id
+            for asset_id in self._edges_by_endpoint.get(threat_cell['id'], [])
+            if asset_id in self.components
+        ]
 
     def to_threagile_format(self) -> Dict[str, Any]:
         """
@@ -760,8 +1185,9 @@ class DiagramParser:
             Dictionnaire au format Threagile
         """
         cells = self._extract_cells()
-        components = self._identify_components(cells)
-        flows = self._identify_flows(cells)
+        # Chaque passe ne parcourt que la partition qui la concerne
+        components = self._identify_components(self._vertex_cells)
+        flows = self._identify_flows(self._edge_cells or [])
         threats = self._extract_threats(cells)
         
         return {
@@ -2,13 +2,20 @@
 Module de gestion des fichiers pour le convertisseur XML/YAML.
 """
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import fnmatch
+import functools
 from pathlib import Path
-from typing import Optional, Union, List, Tuple
+from typing import Any, Callable, Iterator, Optional, Pattern, Set, Union, List, Tuple
 from ..exceptions.converter_exceptions import FileError
 
 logger = logging.getLogger(__name__)
 
+# Répertoires déjà créés ou vérifiés pendant ce processus
+_ENSURED_DIRS: Set[str] = set()
+
 def ensure_directory_exists(filepath: str) -> None:
     """
     Crée le répertoire parent du fichier s'il n'existe pas.
@@ -17,41 +24,57 @@ def ensure_directory_exists(filepath: str) -> None:
         filepath: Chemin du fichier
     """
     directory = os.path.dirname(filepath)
-    if directory and not os.path.exists(directory):
+    if not directory or directory in _ENSURED_DIRS:
+        return
+    try:
         os.makedirs(directory)
         logger.info(f"Created directory: {directory}")
+    except FileExistsError:
+        pass
+    _ENSURED_DIRS.add(directory)
 
-def get_file_size(filepath: str) -> int:
+def get_file_size(filepath: Union[str, os.DirEntry]) -> int:
     """
     Obtient la taille d'un fichier en octets.
     
     Args:
-        filepath: Chemin du fichier
+        filepath: Chemin du fichier, ou entrée os.DirEntry issue d'un
+            parcours (son résultat stat est mis en cache par os.scandir)
         
     Returns:
         Taille du fichier en octets
     """
-    return os.path.getsize(filepath)
+    if isinstance(filepath, os.DirEntry):
+        return filepath.stat().st_size
+    return os.stat(filepath).st_size
 
-def validate_file_size(filepath: str, max_size_mb: int) -> bool:
+def validate_file_size(
+    filepath: Union[str, os.DirEntry],
+    max_size_mb: int,
+    size_bytes: Optional[int] = None
+) -> bool:
     """
     Vérifie si la taille du fichier est inférieure à la limite.
     
     Args:
-        filepath: Chemin du fichier
+        filepath: Chemin du fichier ou entrée os.DirEntry
         max_size_mb: Taille maximale en Mo
+        size_bytes: Taille déjà connue du fichier, qui évite un appel à stat
         
     Returns:
         True si la taille est valide, False sinon
     """
-    try:
-        size_mb = get_file_size(filepath) / (1024 * 1024)
-        if size_mb > max_size_mb:
-            logger.warning(f"File {filepath} is too large ({size_mb:.2f}MB > {max_size_mb}MB)")
-            return False
+    if size_bytes is not None:
+        size = size_bytes
+    else:
+        try:
+            size = get_file_size(filepath)
+        except OSError as e:
+            raise FileError(f"Erreur lors de la vérification de la taille du fichier: {e}")
+    if size <= max_size_mb * 1024 * 1024:
         return True
-    except OSError as e:
-        raise FileError(f"Erreur lors de la vérification de la taille du fichier: {e}")
+    logger.warning(f"File {os.fspath(filepath)} is too large ({size / (1024 * 1024):.2f}MB > {max_size_mb}MB)")
+    return False
 
 def preserve_directory_structure(
     input_file: str,
@@ -69,29 +92,213 @@ def preserve_directory_structure(
     Returns:
         Nouveau chemin du fichier de sortie
     """
-    rel_path = os.path.relpath(input_file, base_dir)
-    output_dir = os.path.dirname(output_file)
-    new_output = os.path.join(output_dir, rel_path)
+    base = base_dir if base_dir.endswith(os.sep) else base_dir + os.sep
+    if input_file.startswith(base):
+        # Cas courant du traitement par lot : simple découpe de chaîne
+        rel_path = input_file[len(base):].lstrip(os.sep)
+    else:
+        rel_path = os.path.relpath(input_file, base_dir)
+    new_output = os.path.join(os.path.dirname(output_file), rel_path)
     ensure_directory_exists(new_output)
     return new_output
 
+def _scan_level(
+    directory: str,
+    matches: Callable[[str], Any]
+) -> Tuple[List[os.DirEntry], List[str]]:
+    """
+    Lit un seul répertoire et sépare fichiers retenus et sous-répertoires.
+    
+    Args:
+        directory: Répertoire à lire
+        matches: Prédicat appliqué au nom de chaque fichier
+        
+    Returns:
+        Tuple (entrées des fichiers correspondants, sous-répertoires à parcourir)
+    """
+    files: List[os.DirEntry] = []
+    subdirs: List[str] = []
+    try:
+        iterator = os.scandir(directory)
+    except OSError:
+        return files, subdirs
+    with iterator:
+        for entry in iterator:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_symlink() and entry.is_dir():
+                # Lien vers un répertoire : ni parcouru ni retenu comme fichier
+                continue
+            elif matches(entry.name):
+                files.append(entry)
+    return files, subdirs
+
+def _scan_directory(directory: str, matches: Callable[[str], Any]) -> Iterator[os.DirEntry]:
+    """
+    Parcourt récursivement un répertoire avec os.scandir.
+    
+    Les liens symboliques vers des répertoires ne sont pas suivis et les
+    répertoires illisibles sont ignorés, comme avec os.walk.
+    
+    Args:
+        directory: Répertoire à scanner
+        matches: Prédicat appliqué au nom de chaque fichier
+        
+    Yields:
+        Entrées os.DirEntry des fichiers correspondants
+    """
+    files, subdirs = _scan_level(directory, matches)
+    yield from files
+    for subdir in subdirs:
+        yield from _scan_directory(subdir, matches)
+
+def _scan_directory_parallel(
+    directory: str,
+    matches: Callable[[str], Any],
+    workers: int
+) -> Iterator[os.DirEntry]:
+    """
+    Parcourt un répertoire niveau par niveau avec un pool de threads.
+    
+    Les appels à os.scandir libèrent le GIL : sur un stockage à forte latence
+    (partage réseau, cache froid), plusieurs répertoires sont lus en même
+    temps. Sur un disque local, le parcours séquentiel reste préférable.
+    
+    Args:
+        directory: Répertoire à scanner
+        matches: Prédicat appliqué au nom de chaque fichier
+        workers: Nombre de threads
+        
+    Yields:
+        Entrées os.DirEntry des fichiers correspondants
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        frontier = [directory]
+        while frontier:
+            next_frontier: List[str] = []
+            for files, subdirs in pool.map(_scan_level, frontier, [matches] * len(frontier)):
+                yield from files
+                next_frontier.extend(subdirs)
+            frontier = next_frontier
+
+def _walk(
+    directory: str,
+    matches: Callable[[str], Any],
+    workers: int
+) -> Iterator[os.DirEntry]:
+    """Choisit le parcours séquentiel ou parallèle selon le nombre de threads."""
+    if workers > 1:
+        return _scan_directory_parallel(directory, matches, workers)
+    return _scan_directory(directory, matches)
+
+@functools.lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> Pattern[str]:
+    """
+    Compile une expression régulière une seule fois par motif.
+    
+    Args:
+        pattern: Expression régulière
+        
+    Returns:
+        Expression régulière compilée
+    """
+    return re.compile(pattern)
+
+def _pattern_matcher(
+    pattern: Union[str, Pattern[str]],
+    regex: bool
+) -> Callable[[str], Any]:
+    """
+    Construit le prédicat appliqué au nom de chaque fichier.
+    
+    Args:
+        pattern: Motif de recherche
+        regex: Si True, un motif textuel est une expression régulière
+        
+    Returns:
+        Prédicat sur le nom de fichier
+    """
+    if regex and isinstance(pattern, str):
+        pattern = _compile_pattern(pattern)
+    if not isinstance(pattern, str):
+        return pattern.match
+    if any(char in pattern for char in '*?['):
+        # Motif glob traduit une seule fois en expression régulière
+        return _compile_pattern(fnmatch.translate(pattern)).match
+    
+    def matches(name: str) -> bool:
+        return pattern in name
+    return matches
+
+def iter_files_to_process(
+    directory: str,
+    pattern: Union[str, Pattern[str]],
+    *,
+    regex: bool = False,
+    workers: int = 1
+) -> Iterator[str]:
+    """
+    Parcourt paresseusement les fichiers à traiter.
+    
+    Args:
+        directory: Répertoire à scanner
+        pattern: Motif de recherche (sous-chaîne du nom de fichier, motif
+            glob s'il contient *, ? ou [, ou expression régulière compilée
+            appliquée avec match)
+        regex: Si True, un motif textuel est traité comme une expression
+            régulière, compilée une seule fois grâce à un cache
+        workers: Nombre de threads lisant les répertoires en parallèle
+            (1 : parcours séquentiel et en profondeur)
+        
+    Yields:
+        Chemins des fichiers correspondants, au fil du parcours
+    """
+    for entry in _walk(directory, _pattern_matcher(pattern, regex), workers):
+        yield entry.path
+
+def iter_file_entries(
+    directory: str,
+    pattern: Union[str, Pattern[str]],
+    *,
+    regex: bool = False,
+    workers: int = 1
+) -> Iterator[os.DirEntry]:
+    """
+    Parcourt paresseusement les fichiers à traiter sous forme d'entrées os.DirEntry.
+    
+    Les entrées peuvent être passées à get_file_size et validate_file_size
+    sans nouvel appel à stat par fichier.
+    
+    Args:
+        directory: Répertoire à scanner
+        pattern: Motif de recherche (voir iter_files_to_process)
+        regex: Si True, un motif textuel est traité comme une expression
+            régulière
+        workers: Nombre de threads (voir iter_files_to_process)
+        
+    Yields:
+        Entrées des fichiers correspondants
+    """
+    return _walk(directory, _pattern_matcher(pattern, regex), workers)
+
 def get_files_to_process(
     directory: str,
-    pattern: str
+    pattern: Union[str, Pattern[str]],
+    *,
+    regex: bool = False,
+    workers: int = 1
 ) -> List[str]:
     """
     Récupère la liste des fichiers à traiter.
     
     Args:
         directory: Répertoire à scanner
-        pattern: Motif de recherche
+        pattern: Motif de recherche (voir iter_files_to_process)
+        regex: Si True, un motif textuel est traité comme une expression
+            régulière
+        workers: Nombre de threads (voir iter_files_to_process)
         
     Returns:
         Liste des fichiers correspondants
     """
-    files = []
-    for root, _, filenames in os.walk(directory):
-        for filename in filenames:
-            if pattern in filename:
-                files.append(os.path.join(root, filename))
-    return files 
\ No newline at end of file
+    return list(iter_files_to_process(directory, pattern, regex=regex, workers=workers))
@@ -2,7 +2,8 @@
 Base de données des menaces connues et leurs caractéristiques.
 """
 
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Tuple
 
 # Facteurs de risque et leurs poids
 RISK_FACTORS = {
@@ -147,6 +148,37 @@ KNOWN_THREATS: Dict[str, Dict[str, Any]] = {
     }
 }
 
+# Index précalculés : KNOWN_THREATS est statique, chaque menace y est
+# matérialisée une seule fois avec son identifiant, en lecture seule et
+# partagée entre tous les appels
+_THREATS_WITH_ID = tuple(
+    MappingProxyType({**threat, 'id': threat_id})
+    for threat_id, threat in KNOWN_THREATS.items()
+)
+_WILDCARD_THREATS = tuple(
+    threat for threat in _THREATS_WITH_ID
+    if '*' in threat['affected_components']
+)
+_THREATS_BY_COMPONENT: Dict[str, Tuple[Mapping[str, Any], ...]] = {
+    component_type: tuple(
+        threat for threat in _THREATS_WITH_ID
+        if '*' in threat['affected_components'] or component_type in threat['affected_components']
+    )
+    for threat in _THREATS_WITH_ID
+    for component_type in threat['affected_components']
+}
+_THREATS_BY_RISK_LEVEL: Dict[str, Tuple[Mapping[str, Any], ...]] = {
+    risk_level: tuple(
+        threat for threat in _THREATS_WITH_ID
+        if threat['base_risk'] >= threshold
+    )
+    for risk_level, threshold in RISK_LEVELS.items()
+}
+_THREATS_ABOVE_ZERO = tuple(
+    threat for threat in _THREATS_WITH_ID
+    if threat['base_risk'] >= 0
+)
+
 def get_threat_info(threat_id: str) -> Dict[str, Any]:
     """
     Récupère les informations d'une menace par son ID.
@@ -168,7 +200,7 @@ def get_all_threats() -> Dict[str, Dict[str, Any]]:
     """
     return KNOWN_THREATS
 
-def get_threats_by_component(component_type: str) -> List[Dict[str, Any]]:
+def get_threats_by_component(component_type: str) -> List[Mapping[str, Any]]:
     """
     Récupère les menaces affectant un type de composant spécifique.
     
@@ -176,15 +208,11 @@ def get_threats_by_component(component_type: str) -> List[Dict[str, Any]]:
         component_type: Type de composant
         
     Returns:
-        Liste des menaces affectant le composant
+        Liste des menaces affectant le composant (vues en lecture seule partagées)
     """
-    return [
-        {**threat, 'id': threat_id}
-        for threat_id, threat in KNOWN_THREATS.items()
-        if '*' in threat['affected_components'] or component_type in threat['affected_components']
-    ]
+    return list(_THREATS_BY_COMPONENT.get(component_type, _WILDCARD_THREATS))
 
-def get_threats_by_risk_level(risk_level: str) -> List[Dict[str, Any]]:
+def get_threats_by_risk_level(risk_level: str) -> List[Mapping[str, Any]]:
     """
     Récupère les menaces d'un niveau de risque spécifique.
     
@@ -192,10 +220,6 @@ def get_threats_by_risk_level(risk_level: str) -> List[Dict[str, Any]]:
         risk_level: Niveau de risque ('critical', 'high', 'medium', 'low')
         
     Returns:
-        Liste des menaces du niveau de risque spécifié
+        Liste des menaces du niveau de risque spécifié (vues en lecture seule partagées)
     """
-    return [
-        {**threat, 'id': threat_id}
-        for threat_id, threat in KNOWN_THREATS.items()
-        if threat['base_risk'] >= RISK_LEVELS.get(risk_level, 0)
-    ] 
\ No newline at end of file
+    return list(_THREATS_BY_RISK_LEVEL.get(risk_level, _THREATS_ABOVE_ZERO)) 
\ No newline at end of file
@@ -2,78 +2,135 @@
 Module de validation et correction des données.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple, Union
+import json
 import logging
+from collections import OrderedDict
+from hashlib import blake2b
+from xml.parsers import expat
+import yaml
 
 logger = logging.getLogger(__name__)
 
-class ValidationResult:
-    """Classe pour stocker les résultats de validation."""
-    def __init__(self, is_valid: bool, warnings: List[str], corrected_data: Dict):
-        self.is_valid = is_valid
-        self.warnings = warnings
-        self.corrected_data = corrected_data
+# Valeurs admises pour les attributs de sécurité
+_AUTH_VALUES = frozenset(('required', 'none'))
+_SENSITIVITY_VALUES = frozenset(('public', 'internal', 'confidential', 'restricted'))
+_BOOL_VALUES = frozenset((True, False))
 
-def validate_and_correct_component(component: Dict, component_types: Dict) -> ValidationResult:
+# Avertissements partagés par tous les résultats sans correction
+_EMPTY_WARNINGS: Tuple[str, ...] = ()
+
+# Chargeur YAML en C (libyaml) lorsqu'il est disponible
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Résultats de validation syntaxique indexés par (format, empreinte du contenu)
+# (les échecs sont conservés avec leur message d'erreur)
+_VALIDATION_CACHE: 'OrderedDict[Tuple[str, bytes], Optional[str]]' = OrderedDict()
+_VALIDATION_CACHE_SIZE = 1024
+
+class ValidationResult(NamedTuple):
+    """
+    Résultats de validation (tuple nommé, sans dictionnaire d'instance).
+    
+    corrected_data est l'objet d'origine lui-même lorsqu'aucune correction
+    n'a été nécessaire, et une copie corrigée sinon ; warnings est alors un
+    tuple vide partagé.
+    """
+    is_valid: bool
+    warnings: Sequence[str]
+    corrected_data: Dict[str, Any]
+
+def validate_and_correct_component(component: Dict[str, Any], component_types: Dict[str, Dict[str, Any]]) -> ValidationResult:
     """
     Valide et corrige un composant.
     Retourne un tuple (is_valid, warnings, corrected_component)
     """
-    warnings = []
-    corrected = component.copy()
+    warnings: Optional[List[str]] = None
+    corrected = component
     
     # Validation des champs requis
     if not corrected.get('id'):
-        warnings.append("ID manquant, génération d'un ID temporaire")
-        corrected['id'] = f"temp_{hash(str(component))}"
+        warnings = _add_warning(warnings, "ID manquant, génération d'un ID temporaire")
+        corrected = _writable(corrected, component)
+        corrected['id'] = _stable_id('temp', component)
     
     if not corrected.get('name'):
-        warnings.append("Nom manquant, utilisation de la valeur par défaut")
+        warnings = _add_warning(warnings, "Nom manquant, utilisation de la valeur par défaut")
+        corrected = _writable(corrected, component)
         corrected['name'] = "Unnamed Component"
     
     # Validation et correction du type
     if not corrected.get('type') or corrected['type'] not in component_types:
-        warnings.append(f"Type invalide ou manquant: {corrected.get('type')}, détection automatique")
+        warnings = _add_warning(warnings, f"Type invalide ou manquant: {corrected.get('type')}, détection automatique")
         # Détection automatique du type basée sur la valeur
+        corrected = _writable(corrected, component)
         corrected['type'] = _detect_component_type(corrected.get('value', ''), component_types)
     
     # Correction des attributs de sécurité
     type_info = component_types.get(corrected['type'], {})
     if type_info:
-        if corrected.get('authentication') not in ['required', 'none']:
-            warnings.append(f"Authentication invalide, utilisation de la valeur par défaut: {type_info['authentication']}")
+        if not _is_allowed(corrected.get('authentication'), _AUTH_VALUES):
+            warnings = _add_warning(warnings, f"Authentication invalide, utilisation de la valeur par défaut: {type_info['authentication']}")
+            corrected = _writable(corrected, component)
             corrected['authentication'] = type_info['authentication']
         
-        if corrected.get('authorization') not in ['required', 'none']:
-            warnings.append(f"Authorization invalide, utilisation de la valeur par défaut: {type_info['authorization']}")
+        if not _is_allowed(corrected.get('authorization'), _AUTH_VALUES):
+            warnings = _add_warning(warnings, f"Authorization invalide, utilisation de la valeur par défaut: {type_info['authorization']}")
+            corrected = _writable(corrected, component)
             corrected['authorization'] = type_info['authorization']
         
-        if corrected.get('data_sensitivity') not in ['public', 'internal', 'confidential', 'restricted']:
-            warnings.append(f"Sensibilité des données invalide, utilisation de la valeur par défaut: {type_info['data_sensitivity']}")
+        if not _is_allowed(corrected.get('data_sensitivity'), _SENSITIVITY_VALUES):
+            warnings = _add_warning(warnings, f"Sensibilité des données invalide, utilisation de la valeur par défaut: {type_info['data_sensitivity']}")
+            corrected = _writable(corrected, component)
             corrected['data_sensitivity'] = type_info['data_sensitivity']
     
-    return ValidationResult(True, warnings, corrected)
+    return ValidationResult(True, warnings or _EMPTY_WARNINGS, corrected)
 
-def validate_and_correct_flow(flow: Dict, components: Dict[str, Dict], protocols: Dict) -> ValidationResult:
+def validate_and_correct_flow(flow: Dict[str, Any], components: Dict[str, Dict[str, Any]], protocols: Dict[str, Dict[str, Any]]) -> ValidationResult:
     """
     Valide et corrige un flux.
     Retourne un tuple (is_valid, warnings, corrected_flow)
     """
-    warnings = []
-    corrected = flow.copy()
+    return _validate_flow(flow, components, protocols, None)
+
+def validate_and_correct_flows(flows: List[Dict[str, Any]], components: Dict[str, Dict[str, Any]], protocols: Dict[str, Dict[str, Any]]) -> List[ValidationResult]:
+    """
+    Valide et corrige une série de flux partageant les mêmes composants.
+    
+    Le composant de repli (le premier du dictionnaire) n'est déterminé
+    qu'une fois pour toute la série.
+    
+    Args:
+        flows: Flux à valider
+        components: Composants indexés par identifiant
+        protocols: Protocoles connus
+        
+    Returns:
+        Résultats de validation, dans l'ordre des flux
+    """
+    first_key = next(iter(components), None)
+    return [_validate_flow(flow, components, protocols, first_key) for flow in flows]
+
+def _validate_flow(flow: Dict[str, Any], components: Dict[str, Dict[str, Any]], protocols: Dict[str, Dict[str, Any]], first_key: Optional[str]) -> ValidationResult:
+    """Valide et corrige un flux, first_key étant le composant de repli s'il est déjà connu."""
+    warnings: Optional[List[str]] = None
+    corrected = flow
     
     # Validation de la source et de la cible
     if not corrected.get('source') or corrected['source'] not in components:
-        warnings.append(f"Source invalide: {corrected.get('source')}, utilisation de la première source valide")
-        corrected['source'] = next(iter(components.keys()))
+        warnings = _add_warning(warnings, f"Source invalide: {corrected.get('source')}, utilisation de la première source valide")
+        corrected = _writable(corrected, flow)
+        corrected['source'] = _first_component_key(components, first_key)
     
     if not corrected.get('target') or corrected['target'] not in components:
-        warnings.append(f"Cible invalide: {corrected.get('target')}, utilisation de la première cible valide")
-        corrected['target'] = next(iter(components.keys()))
+        warnings = _add_warning(warnings, f"Cible invalide: {corrected.get('target')}, utilisation de la première cible valide")
+        corrected = _writable(corrected, flow)
+        corrected['target'] = _first_component_key(components, first_key)
     
     # Validation et correction du protocole
     if not corrected.get('protocol') or corrected['protocol'] not in protocols:
-        warnings.append(f"Protocole invalide: {corrected.get('protocol')}, détection automatique")
+        warnings = _add_warning(warnings, f"Protocole invalide: {corrected.get('protocol')}, détection automatique")
+        corrected = _writable(corrected, flow)
         corrected['protocol'] = _detect_protocol(
             components[corrected['source']],
             components[corrected['target']],
@@ -83,57 +140,248 @@ def validate_and_correct_flow(flow: Dict, components: Dict[str, Dict], protocols
     # Correction des attributs de sécurité
     protocol_info = protocols.get(corrected['protocol'], {})
     if protocol_info:
-        if corrected.get('authentication') not in ['required', 'none']:
-            warnings.append(f"Authentication invalide, utilisation de la valeur par défaut: {protocol_info['authentication']}")
+        if not _is_allowed(corrected.get('authentication'), _AUTH_VALUES):
+            warnings = _add_warning(warnings, f"Authentication invalide, utilisation de la valeur par défaut: {protocol_info['authentication']}")
+            corrected = _writable(corrected, flow)
             corrected['authentication'] = protocol_info['authentication']
         
-        if corrected.get('authorization') not in ['required', 'none']:
-            warnings.append(f"Authorization invalide, utilisation de la valeur par défaut: {protocol_info['authorization']}")
+        if not _is_allowed(corrected.get('authorization'), _AUTH_VALUES):
+            warnings = _add_warning(warnings, f"Authorization invalide, utilisation de la valeur par défaut: {protocol_info['authorization']}")
+            corrected = _writable(corrected, flow)
             corrected['authorization'] = protocol_info['authorization']
         
-        if corrected.get('encryption') not in [True, False]:
-            warnings.append(f"Encryption invalide, utilisation de la valeur par défaut: {protocol_info['encryption']}")
+        if not _is_allowed(corrected.get('encryption'), _BOOL_VALUES):
+            warnings = _add_warning(warnings, f"Encryption invalide, utilisation de la valeur par défaut: {protocol_info['encryption']}")
+            corrected = _writable(corrected, flow)
             corrected['encryption'] = protocol_info['encryption']
     
-    return ValidationResult(True, warnings, corrected)
+    return ValidationResult(True, warnings or _EMPTY_WARNINGS, corrected)
 
-def validate_and_correct_threat(threat: Dict, known_threats: Dict, risk_levels: Dict) -> ValidationResult:
+def validate_and_correct_threat(threat: Dict[str, Any], known_threats: Dict[str, Any], risk_levels: Dict[str, Any]) -> ValidationResult:
     """
     Valide et corrige une menace.
     Retourne un tuple (is_valid, warnings, corrected_threat)
     """
-    warnings = []
-    corrected = threat.copy()
+    warnings: Optional[List[str]] = None
+    corrected = threat
     
     # Validation de l'ID de la menace
     if not corrected.get('id') or corrected['id'] not in known_threats:
-        warnings.append(f"ID de menace invalide: {corrected.get('id')}, génération d'un ID temporaire")
-        corrected['id'] = f"temp_threat_{hash(str(threat))}"
+        warnings = _add_warning(warnings, f"ID de menace invalide: {corrected.get('id')}, génération d'un ID temporaire")
+        corrected = _writable(corrected, threat)
+        corrected['id'] = _stable_id('temp_threat', threat)
     
     # Correction du niveau de risque
     if not corrected.get('risk') or corrected['risk'] not in risk_levels:
-        warnings.append(f"Niveau de risque invalide: {corrected.get('risk')}, utilisation de 'low'")
+        warnings = _add_warning(warnings, f"Niveau de risque invalide: {corrected.get('risk')}, utilisation de 'low'")
+        corrected = _writable(corrected, threat)
         corrected['risk'] = 'low'
     
     # Correction du score de risque
     risk_score = corrected.get('risk_score', 0)
     if not isinstance(risk_score, (int, float)) or not 0 <= risk_score <= 1:
-        warnings.append(f"Score de risque invalide: {risk_score}, normalisation à 0.5")
+        warnings = _add_warning(warnings, f"Score de risque invalide: {risk_score}, normalisation à 0.5")
+        corrected = _writable(corrected, threat)
         corrected['risk_score'] = 0.5
     
-    return ValidationResult(True, warnings, corrected)
+    return ValidationResult(True, warnings or _EMPTY_WARNINGS, corrected)
+
+def validate_xml(content: Union[str, bytes]) -> bool:
+    """
+    Vérifie qu'un contenu XML est bien formé.
+    
+    Le document est seulement analysé par expat, sans gestionnaire
+    d'événements ni construction d'arbre.
+    
+    Args:
+        content: Contenu XML
+        
+    Returns:
+        True si le XML est bien formé, False sinon
+    """
+    return _cached_validation('xml', content, _check_xml)
+
+def _check_xml(content: Union[str, bytes]) -> Optional[str]:
+    """Analyse le XML avec expat, sans gestionnaire d'événements ; retourne l'erreur éventuelle."""
+    try:
+        expat.ParserCreate().Parse(content, True)
+        return None
+    except expat.ExpatError as e:
+        return f"XML invalide: {e}"
+
+def validate_yaml(content: Union[str, bytes]) -> bool:
+    """
+    Vérifie qu'un contenu YAML est syntaxiquement valide.
+    
+    Le flux d'événements est parcouru sans construire d'objets Python.
+    
+    Args:
+        content: Contenu YAML
+        
+    Returns:
+        True si le YAML est valide, False sinon
+    """
+    return _cached_validation('yaml', content, _check_yaml)
+
+def _check_yaml(content: Union[str, bytes]) -> Optional[str]:
+    """Parcourt le flux d'événements YAML ; retourne l'erreur éventuelle."""
+    try:
+        for _ in yaml.parse(content, Loader=_YAML_LOADER):
+            pass
+        return None
+    except yaml.YAMLError as e:
+        return f"YAML invalide: {e}"
+
+def _cached_validation(kind: str, content: Union[str, bytes], check: Callable[[Union[str, bytes]], Optional[str]]) -> bool:
+    """
+    Applique une validation syntaxique en réutilisant le résultat d'un contenu identique.
+    
+    Un contenu invalide déjà rencontré n'est pas réanalysé : son erreur est
+    journalisée en ERROR la première fois, puis en DEBUG.
+    
+    Args:
+        kind: Format validé ('xml' ou 'yaml')
+        content: Contenu à valider
+        check: Fonction de validation retournant le message d'erreur, ou None
+        
+    Returns:
+        True si le contenu est valide, False sinon
+    """
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    key = (kind, blake2b(data, digest_size=16).digest())
+    if key in _VALIDATION_CACHE:
+        _VALIDATION_CACHE.move_to_end(key)
+        error = _VALIDATION_CACHE[key]
+        if error is not None:
+            logger.debug(error)
+        return error is None
+    error = check(content)
+    if error is not None:
+        logger.error(error)
+    _VALIDATION_CACHE[key] = error
+    if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_SIZE:
+        _VALIDATION_CACHE.popitem(last=False)
+    return error is None
+
+def validate_conversion_result(original: object, converted: object) -> bool:
+    """
+    Vérifie que les données converties sont identiques aux données d'origine.
+    
+    La comparaison s'appuie directement sur l'égalité récursive des dict et
+    des listes, sans reconstruire de copie normalisée des deux arbres.
+    
+    Args:
+        original: Données issues du document source
+        converted: Données relues depuis le document converti
+        
+    Returns:
+        True si les deux structures sont égales, False sinon
+    """
+    try:
+        return original == converted
+    except RecursionError:
+        # Arbre trop profond pour la comparaison récursive native
+        return _deep_equal(original, converted)
+    except Exception as e:
+        logger.error(f"Erreur lors de la comparaison du résultat de conversion: {e}")
+        return False
+
+def _deep_equal(a: object, b: object) -> bool:
+    """
+    Compare deux arbres de dict et de listes sans récursion.
+    
+    Les paires de nœuds sont empilées et la comparaison s'arrête à la
+    première différence ; la mémoire utilisée reste proportionnelle à la
+    largeur parcourue, pas à la profondeur de la pile d'appels.
+    
+    Args:
+        a: Premier arbre
+        b: Second arbre
+        
+    Returns:
+        True si les deux arbres sont égaux
+    """
+    stack = [(a, b)]
+    while stack:
+        x, y = stack.pop()
+        if isinstance(x, dict) and isinstance(y, dict):
+            if x.keys() != y.keys():
+                return False
+            stack.extend((x[key], y[key]) for key in x)
+        elif isinstance(x, list) and isinstance(y, list):
+            if len(x) != len(y):
+                return False
+            stack.extend(zip(x, y))
+        elif x != y:
+            return False
+    return True
+
+def _add_warning(warnings: Optional[List[str]], message: str) -> List[str]:
+    """Ajoute un avertissement, la liste n'étant créée qu'au premier."""
+    if warnings is None:
+        return [message]
+    warnings.append(message)
+    return warnings
+
+def _first_component_key(components: Dict[str, Dict[str, Any]], first_key: Optional[str]) -> str:
+    """Retourne le composant de repli, en levant StopIteration s'il n'y a aucun composant."""
+    if first_key is None:
+        return next(iter(components))
+    return first_key
+
+def _writable(corrected: Dict[str, Any], original: Dict[str, Any]) -> Dict[str, Any]:
+    """Copie l'original à la première correction ; les données valides ne sont jamais copiées."""
+    # .copy() : plus rapide que dict(d) ou {**d} pour des dictionnaires de 5 à 50
+    # clés, et conserve le type des sous-classes (OrderedDict...)
+    return original.copy() if corrected is original else corrected
+
+def _canonical_bytes(obj: object) -> bytes:
+    """
+    Sérialise un objet de façon déterministe (clés triées, JSON compact).
+    
+    Seul json est utilisé : orjson écrit l'UTF-8 brut et d'autres formes de
+    flottants (1e20 au lieu de 1e+20), ce qui changerait les identifiants
+    selon qu'il est installé ou non.
+    """
+    try:
+        return json.dumps(obj, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+    except TypeError:
+        # Clés de types non comparables entre eux
+        return repr(obj).encode('utf-8')
+
+def _stable_id(prefix: str, obj: object) -> str:
+    """
+    Génère un identifiant reproductible d'une exécution à l'autre pour un objet.
+    
+    Args:
+        prefix: Préfixe de l'identifiant
+        obj: Objet identifié
+        
+    Returns:
+        Identifiant de la forme '<prefix>_<empreinte hexadécimale>'
+    """
+    return f"{prefix}_{blake2b(_canonical_bytes(obj), digest_size=8).hexdigest()}"
+
+def _is_allowed(value: object, allowed: FrozenSet[object]) -> bool:
+    """Vérifie l'appartenance d'une valeur à un ensemble, les valeurs non hachables étant refusées."""
+    try:
+        return value in allowed
+    except TypeError:
+        return False
 
-def _detect_component_type(value: str, component_types: Dict) -> str:
+def _detect_component_type(value: str, component_types: Dict[str, Dict[str, Any]]) -> str:
     """Détecte automatiquement le type de composant."""
     value = value.lower()
     
+    # Boucle avec sortie au premier mot-clé trouvé : plus rapide qu'une
+    # expression régulière globale pour les quelques types configurés
     for comp_type, info in component_types.items():
         if any(keyword in value for keyword in info['styles']):
             return comp_type
     
     return 'process'  # Type par défaut
 
-def _detect_protocol(source: Dict, target: Dict, protocols: Dict) -> str:
+def _detect_protocol(source: Dict[str, Any], target: Dict[str, Any], protocols: Dict[str, Dict[str, Any]]) -> str:
     """Détecte automatiquement le protocole."""
     source_type = source.get('type', '').lower()
     target_type = target.get('type', '').lower()
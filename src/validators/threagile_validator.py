@@ -2,24 +2,496 @@
 Module de validation pour les données Threagile.
 """
 
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Any
 from dataclasses import dataclass
+from collections import Counter, OrderedDict
+from hashlib import blake2b
+import functools
 import logging
-import yaml
-from pathlib import Path
 import re
-from datetime import datetime
+import json
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - repli sur json
+    _ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# PyYAML et son chargeur sûr, importés à la première utilisation (import coûteux)
+_yaml: Any = None
+_YAML_LOADER: Any = None
+
+# Nombre maximal de résultats de validation conservés par validateur
+_RESULT_CACHE_SIZE = 128
+
+# Début d'un document JSON (objet ou tableau), éventuellement précédé d'espaces
+_JSON_DOCUMENT_START = re.compile(r'\s*[\[{]')
+
+
+def _get_yaml() -> Any:
+    """
+    Importe PyYAML à la première utilisation.
+    
+    Le chargeur sûr retenu est la version C de libyaml si disponible (bien
+    plus rapide), sinon le SafeLoader pur Python.
+    
+    Returns:
+        Le module yaml
+    """
+    global _yaml, _YAML_LOADER
+    if _yaml is None:
+        import yaml
+        _YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        _yaml = yaml
+    return _yaml
+
+def _parse_document(content: str) -> Any:
+    """
+    Parse un document Threagile, JSON en priorité puis YAML.
+    
+    Les documents JSON (sous-ensemble de YAML) sont chargés par orjson ou
+    json, bien plus rapides que PyYAML ; tout échec retombe sur le YAML.
+    
+    Args:
+        content: Le contenu du document
+        
+    Returns:
+        Any: Les données chargées
+    """
+    if isinstance(content, str) and _JSON_DOCUMENT_START.match(content):
+        try:
+            if _ORJSON_AVAILABLE:
+                return orjson.loads(content)
+            return json.loads(content)
+        except ValueError:
+            pass
+    yaml = _get_yaml()
+    return yaml.load(content, Loader=_YAML_LOADER)
+
+
+# Types de composants valides
+_VALID_COMPONENT_TYPES: FrozenSet[str] = frozenset({
+    'web-application',
+    'mobile-app',
+    'desktop-app',
+    'service',
+    'database',
+    'file-storage',
+    'message-queue',
+    'load-balancer',
+    'reverse-proxy',
+    'waf',
+    'ids',
+    'ips',
+    'vpn',
+    'firewall',
+    'gateway',
+    'api-gateway',
+    'service-mesh',
+    'monitoring',
+    'logging',
+    'authentication',
+    'authorization',
+    'key-management',
+    'certificate-management',
+    'secret-management',
+    'identity-management',
+    'access-management',
+    'audit-logging',
+    'backup',
+    'disaster-recovery',
+    'business-continuity',
+    'incident-response',
+    'vulnerability-management',
+    'patch-management',
+    'configuration-management',
+    'change-management',
+    'release-management',
+    'deployment',
+    'container-orchestration',
+    'service-discovery',
+    'api-management',
+    'content-delivery',
+    'dns',
+    'dhcp',
+    'ntp',
+    'syslog',
+    'monitoring-agent',
+    'logging-agent',
+    'security-agent',
+    'endpoint-protection',
+    'mobile-device-management',
+    'unified-endpoint-management',
+    'email',
+    'chat',
+    'collaboration',
+    'document-management',
+    'knowledge-management',
+    'project-management',
+    'issue-tracking',
+    'version-control',
+    'build-automation',
+    'test-automation',
+    'deployment-automation',
+    'infrastructure-as-code',
+    'configuration-as-code',
+    'policy-as-code',
+    'security-as-code',
+    'compliance-as-code',
+    'governance-as-code',
+    'risk-management',
+    'compliance-management',
+    'audit-management',
+    'incident-management',
+    'problem-management',
+    'deployment-management',
+    'asset-management',
+    'license-management',
+    'vendor-management',
+    'contract-management',
+    'service-level-management',
+    'availability-management',
+    'capacity-management',
+    'continuity-management',
+    'security-management'
+})
+
+# Types d'assets valides
+_VALID_ASSET_TYPES: FrozenSet[str] = frozenset({
+    'application',
+    'service',
+    'database',
+    'file-storage',
+    'message-queue',
+    'load-balancer',
+    'reverse-proxy',
+    'waf',
+    'ids',
+    'ips',
+    'vpn',
+    'firewall',
+    'gateway',
+    'api-gateway',
+    'service-mesh',
+    'monitoring',
+    'logging',
+    'authentication',
+    'authorization',
+    'key-management',
+    'certificate-management',
+    'secret-management',
+    'identity-management',
+    'access-management',
+    'audit-logging',
+    'backup',
+    'disaster-recovery',
+    'business-continuity',
+    'incident-response',
+    'vulnerability-management',
+    'patch-management',
+    'configuration-management',
+    'change-management',
+    'release-management',
+    'deployment',
+    'container-orchestration',
+    'service-discovery',
+    'api-management',
+    'content-delivery',
+    'dns',
+    'dhcp',
+    'ntp',
+    'syslog',
+    'monitoring-agent',
+    'logging-agent',
+    'security-agent',
+    'endpoint-protection',
+    'mobile-device-management',
+    'unified-endpoint-management',
+    'email',
+    'chat',
+    'collaboration',
+    'document-management',
+    'knowledge-management',
+    'project-management',
+    'issue-tracking',
+    'version-control',
+    'build-automation',
+    'test-automation',
+    'deployment-automation',
+    'infrastructure-as-code',
+    'configuration-as-code',
+    'policy-as-code',
+    'security-as-code',
+    'compliance-as-code',
+    'governance-as-code',
+    'risk-management',
+    'compliance-management',
+    'audit-management',
+    'incident-management',
+    'problem-management',
+    'deployment-management',
+    'asset-management',
+    'license-management',
+    'vendor-management',
+    'contract-management',
+    'service-level-management',
+    'availability-management',
+    'capacity-management',
+    'continuity-management',
+    'security-management'
+})
+
+# Types de relations valides
+_VALID_RELATION_TYPES: FrozenSet[str] = frozenset({
+    'data-flow',
+    'trust-boundary',
+    'communication',
+    'dependency',
+    'inheritance',
+    'composition',
+    'aggregation',
+    'association'
+})
+
+# Types de limites de confiance valides
+_VALID_BOUNDARY_TYPES: FrozenSet[str] = frozenset({
+    'network',
+    'physical',
+    'logical',
+    'organizational',
+    'legal',
+    'regulatory'
+})
+
+# Drapeau CPython des types pouvant servir de classe de base (Py_TPFLAGS_BASETYPE)
+_TPFLAGS_BASETYPE = 1 << 10
+
+# Signature des vérificateurs de champs générés : (objet, index, errors.append)
+FieldChecker = Callable[[Any, int, Callable[[str], None]], None]
+
+def _field_specs(fields: Dict[Any, Any], label: Optional[str] = None) -> List[Tuple[Any, str, str, str, str]]:
+    """
+    Précalcule, pour chaque champ, les noms de sa constante et de son type
+    dans le code généré, l'expression testant un type invalide et celles de
+    ses messages d'erreur.
+    
+    Le test de type commence par une comparaison d'identité ; isinstance()
+    n'est ajouté que pour les types qui acceptent des sous-classes (un bool,
+    par exemple, ne peut pas être dérivé).
+    
+    Args:
+        fields: Champs attendus et leurs types
+        label: Libellé des éléments d'une liste, ou None pour le premier niveau
+        
+    Returns:
+        Liste de tuples (nom du champ, nom du type, test de type invalide,
+        message manquant, message type invalide)
+    """
+    specs = []
+    for n, (field, field_type) in enumerate(fields.items()):
+        field_name = f'F{n}'
+        type_name = f'T{n}'
+        if label is None:
+            missing = repr(f"Champ requis manquant: {field}")
+            wrong = repr(f"Type invalide pour {field}: attendu ")
+        else:
+            prefix = label.replace('%', '%%') + ' %d: '
+            missing = repr(prefix + f"champ requis manquant: {field}".replace('%', '%%')) + ' % i'
+            wrong = '(' + repr(prefix + f"type invalide pour {field}: attendu ".replace('%', '%%')) + ' % i)'
+        if isinstance(field_type, type):
+            wrong = wrong + ' + ' + repr(field_type.__name__)
+        else:
+            # Type non standard : le nom est résolu à l'exécution, comme auparavant
+            wrong = wrong + f' + {type_name}.__name__'
+        mismatch = f'type(value) is not {type_name}'
+        if not isinstance(field_type, type) or field_type.__flags__ & _TPFLAGS_BASETYPE:
+            mismatch += f' and not isinstance(value, {type_name})'
+        specs.append((field_name, type_name, mismatch, missing, wrong))
+    return specs
+
+def _compile_field_checker(fields: Dict[Any, Any], label: Optional[str] = None) -> FieldChecker:
+    """
+    Génère une fonction vérifiant la présence et le type des champs d'un objet.
+    
+    Le code produit déroule la boucle sur les champs : noms, types et messages
+    d'erreur y sont des constantes, si bien qu'aucun dictionnaire de schéma
+    n'est parcouru ni aucun message formaté tant que l'objet est valide. Pour
+    un dict complet, la présence de tous les champs est vérifiée d'un bloc ;
+    sinon chaque champ est lu par un seul get() au lieu de « in » suivi d'un
+    accès indexé.
+    
+    Args:
+        fields: Champs attendus et leurs types
+        label: Libellé des éléments d'une liste (ex. 'Composant') ; None pour
+            les champs de premier niveau, dont les messages n'ont pas d'index
+        
+    Returns:
+        Fonction check(obj, i, errors_append)
+    """
+    namespace: Dict[str, Any] = {'MISSING': object(), 'REQUIRED': frozenset(fields)}
+    # Noms et types des champs liés comme constantes : la repr() d'une clé
+    # issue du YAML (date, nan...) n'est pas forcément un littéral Python
+    for n, (field, field_type) in enumerate(fields.items()):
+        namespace[f'F{n}'] = field
+        namespace[f'T{n}'] = field_type
+    specs = _field_specs(fields, label)
+    lines = ['def check(obj, i, errors_append):']
+    if specs:
+        # Chemin rapide : un dict exact ; si tous les champs sont présents
+        # (test d'inclusion fait en C), seuls les types restent à vérifier
+        lines.append('    if type(obj) is dict:')
+        lines.append('        if obj.keys() >= REQUIRED:')
+        for field_name, type_name, mismatch, missing, wrong in specs:
+            lines.append(f'            value = obj[{field_name}]')
+            lines.append(f'            if {mismatch}:')
+            lines.append(f'                errors_append({wrong})')
+        lines.append('            return')
+        # Champs manquants : une seule recherche par champ, messages dans l'ordre du schéma
+        lines.append('        get = obj.get')
+        for field_name, type_name, mismatch, missing, wrong in specs:
+            lines.append(f'        value = get({field_name}, MISSING)')
+            lines.append('        if value is MISSING:')
+            lines.append(f'            errors_append({missing})')
+            lines.append(f'        elif {mismatch}:')
+            lines.append(f'            errors_append({wrong})')
+        lines.append('        return')
+    # Cas général (sous-classes de dict, valeurs malformées) : sémantique d'origine
+    for field_name, type_name, mismatch, missing, wrong in specs:
+        lines.append(f'    if {field_name} not in obj:')
+        lines.append(f'        errors_append({missing})')
+        lines.append('    else:')
+        lines.append(f'        value = obj[{field_name}]')
+        lines.append(f'        if {mismatch}:')
+        lines.append(f'            errors_append({wrong})')
+    if len(lines) == 1:
+        lines.append('    pass')
+    exec(compile('\n'.join(lines), f'<field-checker {label or "racine"}>', 'exec'), namespace)
+    checker: FieldChecker = namespace['check']
+    return checker
+
+@functools.lru_cache(maxsize=64)
+def _cached_field_checker(items: Tuple[Tuple[Any, Any], ...], label: Optional[str]) -> FieldChecker:
+    """Compile un vérificateur pour un schéma figé (partagé entre validateurs)."""
+    return _compile_field_checker(dict(items), label)
+
+def _get_field_checker(fields: Dict[Any, Any], label: Optional[str] = None) -> FieldChecker:
+    """
+    Retourne le vérificateur d'un schéma, compilé une seule fois par schéma.
+    
+    Les validateurs construits avec la même configuration (ou celle par
+    défaut) partagent ainsi leurs vérificateurs générés.
+    
+    Args:
+        fields: Champs attendus et leurs types
+        label: Libellé des éléments d'une liste, ou None pour le premier niveau
+        
+    Returns:
+        Fonction check(obj, i, errors_append)
+    """
+    if type(fields) is dict:
+        items = tuple(fields.items())
+        try:
+            return _cached_field_checker(items, label)
+        except TypeError:
+            # Types non hachables (configuration exotique) : pas de cache
+            pass
+    return _compile_field_checker(fields, label)
+
+def _freeze_levels(levels: Any) -> Any:
+    """
+    Convertit les niveaux de sécurité valides en frozensets.
+    
+    Les listes issues d'une configuration YAML deviennent ainsi des ensembles
+    à recherche en O(1) ; les valeurs non convertibles sont laissées telles quelles.
+    
+    Args:
+        levels: Niveaux valides par type (confidentiality, integrity, ...)
+        
+    Returns:
+        Les niveaux, chaque collection convertie en frozenset
+    """
+    if not isinstance(levels, dict):
+        return levels
+    frozen = {}
+    for level_type, valid_levels in levels.items():
+        if isinstance(valid_levels, (list, tuple, set, frozenset)):
+            try:
+                valid_levels = frozenset(valid_levels)
+            except TypeError:
+                # Éléments non hachables : recherche linéaire d'origine
+                pass
+        frozen[level_type] = valid_levels
+    return frozen
+
+# Marqueur d'une section absente des données (distinct d'une valeur null)
+_MISSING: Any = object()
+
+class _Sections(NamedTuple):
+    """Sections de premier niveau d'un document Threagile (_MISSING si absentes)."""
+    components: Any
+    technical_assets: Any
+    data_assets: Any
+    trust_boundaries: Any
+    relations: Any
+
+def _unpack_sections(data: Any) -> _Sections:
+    """
+    Extrait une seule fois les sections de premier niveau des données.
+    
+    Args:
+        data: Les données Threagile
+        
+    Returns:
+        _Sections: Les sections, _MISSING pour celles absentes
+    """
+    if type(data) is dict:
+        get = data.get
+        return _Sections(*[get(key, _MISSING) for key in _Sections._fields])
+    # Autres conteneurs : sémantique d'origine (« in » puis accès indexé)
+    return _Sections(*[data[key] if key in data else _MISSING for key in _Sections._fields])
+
+def _collect_ids(items: Iterable[Any]) -> FrozenSet[Any]:
+    """Collecte les IDs d'une liste d'éléments Threagile."""
+    return frozenset(item['id'] for item in items if 'id' in item)
+
+def _collect_hashable_ids(items: Iterable[Any]) -> FrozenSet[Any]:
+    """
+    Collecte les IDs hachables d'une liste d'éléments Threagile.
+    
+    Un ID non hachable (une liste, par exemple) est déjà signalé comme de type
+    invalide par le vérificateur de champs : il est ignoré ici plutôt que de
+    faire échouer toute la validation.
+    """
+    ids = set()
+    for item in items:
+        if 'id' in item:
+            try:
+                ids.add(item['id'])
+            except TypeError:
+                pass
+    return frozenset(ids)
+
 @dataclass
 class ValidationResult:
-    """Résultat de la validation."""
+    """Résultat de la validation (à slots : pas de __dict__ par instance)."""
+    __slots__ = ('is_valid', 'errors', 'warnings', 'details')
+    
     is_valid: bool
     errors: List[str]
     warnings: List[str]
     details: Dict[str, Any]
 
+def _copy_result(result: ValidationResult) -> ValidationResult:
+    """Copie un résultat de validation pour protéger le cache des modifications."""
+    return ValidationResult(
+        is_valid=result.is_valid,
+        errors=list(result.errors),
+        warnings=list(result.warnings),
+        details=dict(result.details)
+    )
+
 class ThreagileValidator:
     """Classe pour la validation des données Threagile."""
     
@@ -157,12 +629,23 @@ class ThreagileValidator:
             'max_relations': 100
         })
         
+        # Expressions régulières des règles, compilées une seule fois
+        self._compiled_rules: Dict[str, 're.Pattern[str]'] = {}
+        for rule_name in ('component_naming', 'asset_naming', 'date_format'):
+            rule = self.validation_rules.get(rule_name)
+            if isinstance(rule, str):
+                try:
+                    self._compiled_rules[rule_name] = re.compile(rule)
+                except re.error:
+                    # Motif invalide : signalé par la validation qui l'utilise
+                    pass
+        
         # Niveaux de sécurité valides
-        self.valid_security_levels = self.config.get('security_levels', {
+        self.valid_security_levels = _freeze_levels(self.config.get('security_levels', {
             'confidentiality': {'public', 'internal', 'restricted', 'confidential', 'strictly-confidential'},
             'integrity': {'operational', 'important', 'critical', 'mission-critical'},
             'availability': {'operational', 'important', 'critical', 'mission-critical'}
-        })
+        }))
         
         # Règles de conformité Threagile
         self.threagile_compliance_rules = self.config.get('compliance_rules', {
@@ -178,16 +661,30 @@ class ThreagileValidator:
         })
         
         # Types de composants valides
-        self.valid_component_types = self._get_valid_component_types()
+        self.valid_component_types = _VALID_COMPONENT_TYPES
         
         # Types d'assets valides
-        self.valid_asset_types = self._get_valid_asset_types()
+        self.valid_asset_types = _VALID_ASSET_TYPES
         
         # Types de relations valides
-        self.valid_relation_types = self._get_valid_relation_types()
+        self.valid_relation_types = _VALID_RELATION_TYPES
         
         # Types de limites de confiance valides
-        self.valid_boundary_types = self._get_valid_boundary_types()
+        self.valid_boundary_types = _VALID_BOUNDARY_TYPES
+        
+        # Cache des résultats de validation, indexé par empreinte du contenu ;
+        # seules les données du dernier document parsé sont conservées
+        self._result_cache: 'OrderedDict[bytes, ValidationResult]' = OrderedDict()
+        self._last_document: Optional[Tuple[bytes, Any]] = None
+        
+        # Vérificateurs de champs générés à partir des schémas ci-dessus,
+        # partagés entre les validateurs de même configuration
+        self._check_required_fields = _get_field_checker(self.required_fields)
+        self._check_component_fields = _get_field_checker(self.component_fields, 'Composant')
+        self._check_technical_asset_fields = _get_field_checker(self.technical_asset_fields, 'Asset')
+        self._check_data_asset_fields = _get_field_checker(self.data_asset_fields, 'Asset de données')
+        self._check_trust_boundary_fields = _get_field_checker(self.trust_boundary_fields, 'Limite de confiance')
+        self._check_relation_fields = _get_field_checker(self.relation_fields, 'Relation')
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """
@@ -201,140 +698,149 @@ class ThreagileValidator:
         """
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+                return _parse_document(f.read())
         except Exception as e:
-            logger.warning(f"Impossible de charger la configuration: {str(e)}")
+            logger.warning("Impossible de charger la configuration: %s", e)
             return {}
     
-    def _get_valid_relation_types(self) -> Set[str]:
+    def _get_valid_relation_types(self) -> FrozenSet[str]:
         """Retourne l'ensemble des types de relations valides."""
-        return {
-            'data-flow',
-            'trust-boundary',
-            'communication',
-            'dependency',
-            'inheritance',
-            'composition',
-            'aggregation',
-            'association'
-        }
-    
-    def _get_valid_boundary_types(self) -> Set[str]:
+        return _VALID_RELATION_TYPES
+    
+    def _get_valid_boundary_types(self) -> FrozenSet[str]:
         """Retourne l'ensemble des types de limites de confiance valides."""
-        return {
-            'network',
-            'physical',
-            'logical',
-            'organizational',
-            'legal',
-            'regulatory'
-        }
+        return _VALID_BOUNDARY_TYPES
     
     def _validate_data_assets(self, data_assets: List[Dict]) -> Tuple[List[str], List[str]]:
         """Valide la liste des assets de données."""
-        errors = []
-        warnings = []
+        errors: List[str] = []
+        warnings: List[str] = []
+        check_fields = self._check_data_asset_fields
+        errors_append = errors.append
+        warnings_append = warnings.append
+        rules = self.validation_rules
+        min_name_length = rules['min_name_length']
+        max_name_length = rules['max_name_length']
+        min_description_length = rules['min_description_length']
+        max_description_length = rules['max_description_length']
+        valid_classifications = self.valid_security_levels['confidentiality']
         
         for i, asset in enumerate(data_assets):
             # Vérification des champs requis
-            for field, field_type in self.data_asset_fields.items():
-                if field not in asset:
-                    errors.append(f"Asset de données {i}: champ requis manquant: {field}")
-                elif not isinstance(asset[field], field_type):
-                    errors.append(f"Asset de données {i}: type invalide pour {field}: attendu {field_type.__name__}")
+            check_fields(asset, i, errors_append)
             
             # Vérifications supplémentaires
-            if 'data_classification' in asset and asset['data_classification'] not in self.valid_security_levels['confidentiality']:
-                warnings.append(f"Asset de données {i}: classification de données invalide: {asset['data_classification']}")
+            if 'data_classification' in asset and asset['data_classification'] not in valid_classifications:
+                warnings_append(f"Asset de données {i}: classification de données invalide: {asset['data_classification']}")
             
             # Validation des longueurs
             if 'name' in asset:
-                if len(asset['name']) < self.validation_rules['min_name_length']:
-                    warnings.append(f"Asset de données {i}: nom trop court")
-                elif len(asset['name']) > self.validation_rules['max_name_length']:
-                    warnings.append(f"Asset de données {i}: nom trop long")
+                name_length = len(asset['name'])
+                if name_length < min_name_length:
+                    warnings_append(f"Asset de données {i}: nom trop court")
+                elif name_length > max_name_length:
+                    warnings_append(f"Asset de données {i}: nom trop long")
             
             if 'description' in asset:
-                if len(asset['description']) < self.validation_rules['min_description_length']:
-                    warnings.append(f"Asset de données {i}: description trop courte")
-                elif len(asset['description']) > self.validation_rules['max_description_length']:
-                    warnings.append(f"Asset de données {i}: description trop longue")
+                description_length = len(asset['description'])
+                if description_length < min_description_length:
+                    warnings_append(f"Asset de données {i}: description trop courte")
+                elif description_length > max_description_length:
+                    warnings_append(f"Asset de données {i}: description trop longue")
         
         return errors, warnings
     
     def _validate_trust_boundaries(self, boundaries: List[Dict]) -> Tuple[List[str], List[str]]:
         """Valide la liste des limites de confiance."""
-        errors = []
-        warnings = []
+        errors: List[str] = []
+        warnings: List[str] = []
+        check_fields = self._check_trust_boundary_fields
+        errors_append = errors.append
+        warnings_append = warnings.append
+        rules = self.validation_rules
+        min_name_length = rules['min_name_length']
+        max_name_length = rules['max_name_length']
+        min_description_length = rules['min_description_length']
+        max_description_length = rules['max_description_length']
+        valid_boundary_types = self.valid_boundary_types
         
         for i, boundary in enumerate(boundaries):
             # Vérification des champs requis
-            for field, field_type in self.trust_boundary_fields.items():
-                if field not in boundary:
-                    errors.append(f"Limite de confiance {i}: champ requis manquant: {field}")
-                elif not isinstance(boundary[field], field_type):
-                    errors.append(f"Limite de confiance {i}: type invalide pour {field}: attendu {field_type.__name__}")
+            check_fields(boundary, i, errors_append)
             
             # Vérifications supplémentaires
-            if 'type' in boundary and boundary['type'] not in self.valid_boundary_types:
-                warnings.append(f"Limite de confiance {i}: type invalide: {boundary['type']}")
+            if 'type' in boundary and boundary['type'] not in valid_boundary_types:
+                warnings_append(f"Limite de confiance {i}: type invalide: {boundary['type']}")
             
             # Validation des longueurs
             if 'name' in boundary:
-                if len(boundary['name']) < self.validation_rules['min_name_length']:
-                    warnings.append(f"Limite de confiance {i}: nom trop court")
-                elif len(boundary['name']) > self.validation_rules['max_name_length']:
-                    warnings.append(f"Limite de confiance {i}: nom trop long")
+                name_length = len(boundary['name'])
+                if name_length < min_name_length:
+                    warnings_append(f"Limite de confiance {i}: nom trop court")
+                elif name_length > max_name_length:
+                    warnings_append(f"Limite de confiance {i}: nom trop long")
             
             if 'description' in boundary:
-                if len(boundary['description']) < self.validation_rules['min_description_length']:
-                    warnings.append(f"Limite de confiance {i}: description trop courte")
-                elif len(boundary['description']) > self.validation_rules['max_description_length']:
-                    warnings.append(f"Limite de confiance {i}: description trop longue")
+                description_length = len(boundary['description'])
+                if description_length < min_description_length:
+                    warnings_append(f"Limite de confiance {i}: description trop courte")
+                elif description_length > max_description_length:
+                    warnings_append(f"Limite de confiance {i}: description trop longue")
         
         return errors, warnings
     
-    def _validate_relations(self, relations: List[Dict], components: List[Dict], assets: List[Dict]) -> Tuple[List[str], List[str]]:
-        """Valide la liste des relations."""
-        errors = []
-        warnings = []
+    def _validate_relations(self, relations: List[Dict], valid_ids: FrozenSet[Any]) -> Tuple[List[str], List[str]]:
+        """
+        Valide la liste des relations.
         
-        # Création des sets d'IDs pour la validation
-        component_ids = {comp['id'] for comp in components if 'id' in comp}
-        asset_ids = {asset['id'] for asset in assets if 'id' in asset}
-        valid_ids = component_ids | asset_ids
+        Args:
+            relations: Les relations à valider
+            valid_ids: IDs des composants et assets techniques référençables
+            
+        Returns:
+            Tuple[List[str], List[str]]: Les erreurs et avertissements
+        """
+        errors: List[str] = []
+        warnings: List[str] = []
+        check_fields = self._check_relation_fields
+        errors_append = errors.append
+        warnings_append = warnings.append
+        rules = self.validation_rules
+        min_name_length = rules['min_name_length']
+        max_name_length = rules['max_name_length']
+        min_description_length = rules['min_description_length']
+        max_description_length = rules['max_description_length']
+        valid_relation_types = self.valid_relation_types
         
         for i, relation in enumerate(relations):
             # Vérification des champs requis
-            for field, field_type in self.relation_fields.items():
-                if field not in relation:
-                    errors.append(f"Relation {i}: champ requis manquant: {field}")
-                elif not isinstance(relation[field], field_type):
-                    errors.append(f"Relation {i}: type invalide pour {field}: attendu {field_type.__name__}")
+            check_fields(relation, i, errors_append)
             
             # Vérifications supplémentaires
-            if 'type' in relation and relation['type'] not in self.valid_relation_types:
-                warnings.append(f"Relation {i}: type invalide: {relation['type']}")
+            if 'type' in relation and relation['type'] not in valid_relation_types:
+                warnings_append(f"Relation {i}: type invalide: {relation['type']}")
             
             # Validation des références
             if 'source' in relation and relation['source'] not in valid_ids:
-                errors.append(f"Relation {i}: source invalide: {relation['source']}")
+                errors_append(f"Relation {i}: source invalide: {relation['source']}")
             
             if 'target' in relation and relation['target'] not in valid_ids:
-                errors.append(f"Relation {i}: cible invalide: {relation['target']}")
+                errors_append(f"Relation {i}: cible invalide: {relation['target']}")
             
             # Validation des longueurs
             if 'name' in relation:
-                if len(relation['name']) < self.validation_rules['min_name_length']:
-                    warnings.append(f"Relation {i}: nom trop court")
-                elif len(relation['name']) > self.validation_rules['max_name_length']:
-                    warnings.append(f"Relation {i}: nom trop long")
+                name_length = len(relation['name'])
+                if name_length < min_name_length:
+                    warnings_append(f"Relation {i}: nom trop court")
+                elif name_length > max_name_length:
+                    warnings_append(f"Relation {i}: nom trop long")
             
             if 'description' in relation:
-                if len(relation['description']) < self.validation_rules['min_description_length']:
-                    warnings.append(f"Relation {i}: description trop courte")
-                elif len(relation['description']) > self.validation_rules['max_description_length']:
-                    warnings.append(f"Relation {i}: description trop longue")
+                description_length = len(relation['description'])
+                if description_length < min_description_length:
+                    warnings_append(f"Relation {i}: description trop courte")
+                elif description_length > max_description_length:
+                    warnings_append(f"Relation {i}: description trop longue")
         
         return errors, warnings
     
@@ -345,12 +851,95 @@ class ThreagileValidator:
         Args:
             yaml_content: Le contenu YAML à valider
             
+        Returns:
+            ValidationResult: Le résultat de la validation
+        """
+        return self._load_and_validate(yaml_content)[0]
+    
+    def _load_and_validate(self, yaml_content: str, with_data: bool = False) -> Tuple[ValidationResult, Any]:
+        """
+        Parse et valide le contenu YAML, en réutilisant le résultat d'un contenu identique.
+        
+        Le cache est indexé par une empreinte BLAKE2b du contenu ; une copie du
+        résultat est renvoyée pour que l'appelant puisse la modifier librement.
+        Seules les données du dernier document parsé sont gardées : un document
+        valide plus ancien est parsé à nouveau si ses données sont demandées.
+        
+        Args:
+            yaml_content: Le contenu YAML à valider
+            with_data: Renvoie aussi les données parsées d'un document valide
+            
+        Returns:
+            Tuple[ValidationResult, Any]: Le résultat et les données parsées (None en cas
+            d'erreur de parsing, ou si elles n'ont pas été demandées)
+        """
+        if not isinstance(yaml_content, str):
+            return self._parse_and_validate(yaml_content)
+        
+        key = blake2b(yaml_content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        cache = self._result_cache
+        result = cache.get(key)
+        if result is None:
+            result, data = self._parse_and_validate(yaml_content)
+            cache[key] = result
+            if len(cache) > _RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+            self._last_document = (key, data)
+        else:
+            cache.move_to_end(key)
+            last = self._last_document
+            if last is not None and last[0] == key:
+                data = last[1]
+            elif with_data and result.is_valid:
+                data = _parse_document(yaml_content)
+                self._last_document = (key, data)
+            else:
+                data = None
+        return _copy_result(result), data
+    
+    def _parse_and_validate(self, yaml_content: str) -> Tuple[ValidationResult, Any]:
+        """
+        Parse le contenu YAML une seule fois puis le valide.
+        
+        Args:
+            yaml_content: Le contenu YAML à valider
+            
+        Returns:
+            Tuple[ValidationResult, Any]: Le résultat et les données parsées (None en cas d'erreur de parsing)
+        """
+        try:
+            # Parsing du document (JSON rapide, sinon YAML via libyaml si disponible)
+            data = _parse_document(yaml_content)
+        except Exception as e:
+            # Une erreur YAML implique que PyYAML a déjà été importé
+            if _yaml is not None and isinstance(e, _yaml.YAMLError):
+                logger.error("Erreur de parsing YAML: %s", e)
+                return ValidationResult(
+                    is_valid=False,
+                    errors=[f"Erreur de parsing YAML: {str(e)}"],
+                    warnings=[],
+                    details={}
+                ), None
+            logger.error("Erreur inattendue lors de la validation: %s", e)
+            return ValidationResult(
+                is_valid=False,
+                errors=[f"Erreur inattendue: {str(e)}"],
+                warnings=[],
+                details={}
+            ), None
+        return self._validate_parsed(data), data
+    
+    def _validate_parsed(self, data: Any) -> ValidationResult:
+        """
+        Valide des données YAML déjà chargées.
+        
+        Args:
+            data: Les données issues du parsing YAML
+            
         Returns:
             ValidationResult: Le résultat de la validation
         """
         try:
-            # Parsing du YAML
-            data = yaml.safe_load(yaml_content)
             if not data:
                 return ValidationResult(
                     is_valid=False,
@@ -359,59 +948,56 @@ class ThreagileValidator:
                     details={}
                 )
             
-            errors = []
-            warnings = []
-            details = {}
+            errors: List[str] = []
+            warnings: List[str] = []
+            details: Dict[str, Any] = {}
             
             # Validation des champs requis
-            for field, field_type in self.required_fields.items():
-                if field not in data:
-                    errors.append(f"Champ requis manquant: {field}")
-                elif not isinstance(data[field], field_type):
-                    errors.append(f"Type invalide pour {field}: attendu {field_type.__name__}")
+            self._check_required_fields(data, 0, errors.append)
+            
+            # Extraction des sections, une seule recherche chacune
+            sections = _unpack_sections(data)
+            components = sections.components
+            technical_assets = sections.technical_assets
             
             # Validation des composants
-            if 'components' in data:
-                component_errors, component_warnings = self._validate_components(data['components'])
+            if components is not _MISSING:
+                component_errors, component_warnings = self._validate_components(components)
                 errors.extend(component_errors)
                 warnings.extend(component_warnings)
             
             # Validation des assets techniques
-            if 'technical_assets' in data:
-                asset_errors, asset_warnings = self._validate_technical_assets(data['technical_assets'])
+            if technical_assets is not _MISSING:
+                asset_errors, asset_warnings = self._validate_technical_assets(technical_assets)
                 errors.extend(asset_errors)
                 warnings.extend(asset_warnings)
             
             # Validation des assets de données
-            if 'data_assets' in data:
-                data_asset_errors, data_asset_warnings = self._validate_data_assets(data['data_assets'])
+            if sections.data_assets is not _MISSING:
+                data_asset_errors, data_asset_warnings = self._validate_data_assets(sections.data_assets)
                 errors.extend(data_asset_errors)
                 warnings.extend(data_asset_warnings)
             
             # Validation des limites de confiance
-            if 'trust_boundaries' in data:
-                boundary_errors, boundary_warnings = self._validate_trust_boundaries(data['trust_boundaries'])
+            if sections.trust_boundaries is not _MISSING:
+                boundary_errors, boundary_warnings = self._validate_trust_boundaries(sections.trust_boundaries)
                 errors.extend(boundary_errors)
                 warnings.extend(boundary_warnings)
             
-            # Validation des relations
-            if 'relations' in data:
+            # Validation des relations, avec des IDs collectés une seule fois
+            asset_ids: Optional[FrozenSet[Any]] = None
+            if sections.relations is not _MISSING:
+                component_ids = _collect_ids(components if components is not _MISSING else ())
+                asset_ids = _collect_ids(technical_assets if technical_assets is not _MISSING else ())
                 relation_errors, relation_warnings = self._validate_relations(
-                    data['relations'],
-                    data.get('components', []),
-                    data.get('technical_assets', [])
+                    sections.relations,
+                    component_ids | asset_ids
                 )
                 errors.extend(relation_errors)
                 warnings.extend(relation_warnings)
             
-            # Validation des règles de conformité
-            self._validate_threagile_compliance(data, errors, warnings)
-            
-            # Validation des IDs uniques
-            self._validate_unique_ids(data, errors)
-            
-            # Validation des relations
-            self._validate_relationships(data, errors, warnings)
+            # Validation de la conformité, des IDs uniques et des relations
+            self._validate_global(sections, errors, warnings, asset_ids, check_unique_ids=True)
             
             return ValidationResult(
                 is_valid=len(errors) == 0,
@@ -420,16 +1006,8 @@ class ThreagileValidator:
                 details=details
             )
             
-        except yaml.YAMLError as e:
-            logger.error(f"Erreur de parsing YAML: {str(e)}")
-            return ValidationResult(
-                is_valid=False,
-                errors=[f"Erreur de parsing YAML: {str(e)}"],
-                warnings=[],
-                details={}
-            )
         except Exception as e:
-            logger.error(f"Erreur inattendue lors de la validation: {str(e)}")
+            logger.error("Erreur inattendue lors de la validation: %s", e)
             return ValidationResult(
                 is_valid=False,
                 errors=[f"Erreur inattendue: {str(e)}"],
@@ -439,16 +1017,14 @@ class ThreagileValidator:
     
     def _validate_components(self, components: List[Dict]) -> Tuple[List[str], List[str]]:
         """Valide la liste des composants."""
-        errors = []
-        warnings = []
+        errors: List[str] = []
+        warnings: List[str] = []
+        check_fields = self._check_component_fields
+        errors_append = errors.append
         
         for i, component in enumerate(components):
             # Vérification des champs requis
-            for field, field_type in self.component_fields.items():
-                if field not in component:
-                    errors.append(f"Composant {i}: champ requis manquant: {field}")
-                elif not isinstance(component[field], field_type):
-                    errors.append(f"Composant {i}: type invalide pour {field}: attendu {field_type.__name__}")
+            check_fields(component, i, errors_append)
             
             # Vérifications supplémentaires
             if 'type' in component and component['type'] not in self.valid_component_types:
@@ -458,16 +1034,14 @@ class ThreagileValidator:
     
     def _validate_technical_assets(self, assets: List[Dict]) -> Tuple[List[str], List[str]]:
         """Valide la liste des assets techniques."""
-        errors = []
-        warnings = []
+        errors: List[str] = []
+        warnings: List[str] = []
+        check_fields = self._check_technical_asset_fields
+        errors_append = errors.append
         
         for i, asset in enumerate(assets):
             # Vérification des champs requis
-            for field, field_type in self.technical_asset_fields.items():
-                if field not in asset:
-                    errors.append(f"Asset {i}: champ requis manquant: {field}")
-                elif not isinstance(asset[field], field_type):
-                    errors.append(f"Asset {i}: type invalide pour {field}: attendu {field_type.__name__}")
+            check_fields(asset, i, errors_append)
             
             # Vérifications supplémentaires
             if 'type' in asset and asset['type'] not in self.valid_asset_types:
@@ -475,281 +1049,91 @@ class ThreagileValidator:
         
         return errors, warnings
     
-    def _validate_threagile_compliance(self, data: Dict, errors: List[str], warnings: List[str]) -> None:
-        """Valide la conformité avec les règles Threagile."""
+    def _validate_global(self, sections: '_Sections', errors: List[str], warnings: List[str],
+                         asset_ids: Optional[FrozenSet[Any]] = None,
+                         check_unique_ids: Optional[bool] = None) -> None:
+        """
+        Valide en une passe la conformité Threagile, l'unicité des IDs et les
+        références des composants vers les assets techniques et de données.
+        
+        Args:
+            sections: Les sections des données Threagile
+            errors: Liste des erreurs à compléter
+            warnings: Liste des avertissements à compléter
+            asset_ids: IDs des assets techniques déjà collectés (optionnel)
+            check_unique_ids: Force la vérification de l'unicité des IDs ;
+                par défaut, la règle de conformité 'unique_ids' décide
+        """
         rules = self.threagile_compliance_rules
+        if check_unique_ids is None:
+            check_unique_ids = rules['unique_ids']
         
-        # Vérification des limites de confiance
-        if rules['required_trust_boundaries'] and 'trust_boundaries' in data:
-            if not data['trust_boundaries']:
-                errors.append("Au moins une limite de confiance est requise")
-        
-        # Vérification des assets de données
-        if rules['required_data_assets'] and 'data_assets' in data:
-            if not data['data_assets']:
-                errors.append("Au moins un asset de données est requis")
-        
-        # Vérification des assets techniques
-        if rules['required_technical_assets'] and 'technical_assets' in data:
-            if not data['technical_assets']:
-                errors.append("Au moins un asset technique est requis")
-        
-        # Vérification des IDs uniques
-        if rules['unique_ids']:
-            self._validate_unique_ids(data, errors)
-    
-    def _validate_unique_ids(self, data: Dict, errors: List[str]) -> None:
-        """Valide l'unicité des IDs."""
-        all_ids = set()
-        
-        # Collecte des IDs de composants
-        if 'components' in data:
-            for i, component in enumerate(data['components']):
-                if 'id' in component:
-                    if component['id'] in all_ids:
-                        errors.append(f"ID dupliqué trouvé: {component['id']}")
-                    all_ids.add(component['id'])
-        
-        # Collecte des IDs d'assets
-        if 'technical_assets' in data:
-            for i, asset in enumerate(data['technical_assets']):
-                if 'id' in asset:
-                    if asset['id'] in all_ids:
-                        errors.append(f"ID dupliqué trouvé: {asset['id']}")
-                    all_ids.add(asset['id'])
-    
-    def _validate_relationships(self, data: Dict, errors: List[str], warnings: List[str]) -> None:
-        """Valide les relations entre les éléments."""
-        if 'components' in data and 'technical_assets' in data:
-            # Création des sets d'IDs pour la validation
-            component_ids = {comp['id'] for comp in data['components'] if 'id' in comp}
-            asset_ids = {asset['id'] for asset in data['technical_assets'] if 'id' in asset}
-            
-            # Validation des références dans les composants
-            for i, component in enumerate(data['components']):
-                if 'technical_assets' in component:
-                    for asset_id in component['technical_assets']:
-                        if asset_id not in asset_ids:
-                            errors.append(f"Composant {i}: référence à un asset inexistant: {asset_id}")
-                
-                if 'data_assets' in component:
-                    for data_id in component['data_assets']:
-                        if data_id not in asset_ids:
-                            errors.append(f"Composant {i}: référence à un asset de données inexistant: {data_id}")
+        components = sections.components
+        technical_assets = sections.technical_assets
+        has_components = components is not _MISSING
+        has_assets = technical_assets is not _MISSING
+        
+        # Vérification des limites de confiance, assets de données et assets techniques
+        if rules['required_trust_boundaries'] and sections.trust_boundaries is not _MISSING and not sections.trust_boundaries:
+            errors.append("Au moins une limite de confiance est requise")
+        if rules['required_data_assets'] and sections.data_assets is not _MISSING and not sections.data_assets:
+            errors.append("Au moins un asset de données est requis")
+        if rules['required_technical_assets'] and has_assets and not technical_assets:
+            errors.append("Au moins un asset technique est requis")
         
-    def _get_valid_component_types(self) -> Set[str]:
+        check_references = has_components and has_assets
+        known_assets: FrozenSet[Any] = frozenset()
+        # IDs des assets de données, collectés à la première référence rencontrée
+        known_data_assets: Optional[FrozenSet[Any]] = None
+        if check_references:
+            known_assets = asset_ids if asset_ids is not None else _collect_ids(technical_assets)
+        
+        # Parcours unique des composants : collecte des IDs et références
+        ids: List[Any] = []
+        ids_append = ids.append
+        reference_errors: List[str] = []
+        reference_errors_append = reference_errors.append
+        if has_components and (check_unique_ids or check_references):
+            for i, component in enumerate(components):
+                if check_unique_ids and 'id' in component:
+                    ids_append(component['id'])
+                if check_references:
+                    if 'technical_assets' in component:
+                        reference_errors.extend([
+                            f"Composant {i}: référence à un asset inexistant: {asset_id}"
+                            for asset_id in component['technical_assets']
+                            if asset_id not in known_assets
+                        ])
+                    
+                    if 'data_assets' in component:
+                        for data_id in component['data_assets']:
+                            if known_data_assets is None:
+                                data_assets = sections.data_assets
+                                known_data_assets = _collect_hashable_ids(data_assets if data_assets is not _MISSING else ())
+                            if data_id not in known_data_assets:
+                                reference_errors_append(f"Composant {i}: référence à un asset de données inexistant: {data_id}")
+        
+        # Unicité des IDs (un message par ID dupliqué), puis erreurs de références
+        if check_unique_ids:
+            if has_assets:
+                ids.extend(asset['id'] for asset in technical_assets if 'id' in asset)
+            # Cas courant sans doublon : un seul set() construit en C suffit ;
+            # sinon Counter (comptage en C) conserve l'ordre de première apparition
+            if len(set(ids)) != len(ids):
+                errors.extend(
+                    f"ID dupliqué trouvé: {item_id}"
+                    for item_id, count in Counter(ids).items()
+                    if count > 1
+                )
+        errors.extend(reference_errors)
+    
+    def _get_valid_component_types(self) -> FrozenSet[str]:
         """Retourne l'ensemble des types de composants valides."""
-        return {
-            'web-application',
-            'mobile-app',
-            'desktop-app',
-            'service',
-            'database',
-            'file-storage',
-            'message-queue',
-            'load-balancer',
-            'reverse-proxy',
-            'waf',
-            'ids',
-            'ips',
-            'vpn',
-            'firewall',
-            'gateway',
-            'api-gateway',
-            'service-mesh',
-            'monitoring',
-            'logging',
-            'authentication',
-            'authorization',
-            'key-management',
-            'certificate-management',
-            'secret-management',
-            'identity-management',
-            'access-management',
-            'audit-logging',
-            'backup',
-            'disaster-recovery',
-            'business-continuity',
-            'incident-response',
-            'vulnerability-management',
-            'patch-management',
-            'configuration-management',
-            'change-management',
-            'release-management',
-            'deployment',
-            'container-orchestration',
-            'service-discovery',
-            'api-management',
-            'content-delivery',
-            'dns',
-            'dhcp',
-            'ntp',
-            'syslog',
-            'monitoring-agent',
-            'logging-agent',
-            'security-agent',
-            'endpoint-protection',
-            'mobile-device-management',
-            'unified-endpoint-management',
-            'email',
-            'chat',
-            'collaboration',
-            'document-management',
-            'knowledge-management',
-            'project-management',
-            'issue-tracking',
-            'version-control',
-            'build-automation',
-            'test-automation',
-            'deployment-automation',
-            'infrastructure-as-code',
-            'configuration-as-code',
-            'policy-as-code',
-            'security-as-code',
-            'compliance-as-code',
-            'governance-as-code',
-            'risk-management',
-            'compliance-management',
-            'audit-management',
-            'incident-management',
-            'problem-management',
-            'change-management',
-            'release-management',
-            'deployment-management',
-            'configuration-management',
-            'asset-management',
-            'license-management',
-            'vendor-management',
-            'contract-management',
-            'service-level-management',
-            'availability-management',
-            'capacity-management',
-            'continuity-management',
-            'security-management',
-            'risk-management',
-            'compliance-management',
-            'audit-management',
-            'incident-management',
-            'problem-management',
-            'change-management',
-            'release-management',
-            'deployment-management',
-            'configuration-management',
-            'asset-management',
-            'license-management',
-            'vendor-management',
-            'contract-management',
-            'service-level-management',
-            'availability-management',
-            'capacity-management',
-            'continuity-management'
-        }
-    
-    def _get_valid_asset_types(self) -> Set[str]:
+        return _VALID_COMPONENT_TYPES
+    
+    def _get_valid_asset_types(self) -> FrozenSet[str]:
         """Retourne l'ensemble des types d'assets valides."""
-        return {
-            'application',
-            'service',
-            'database',
-            'file-storage',
-            'message-queue',
-            'load-balancer',
-            'reverse-proxy',
-            'waf',
-            'ids',
-            'ips',
-            'vpn',
-            'firewall',
-            'gateway',
-            'api-gateway',
-            'service-mesh',
-            'monitoring',
-            'logging',
-            'authentication',
-            'authorization',
-            'key-management',
-            'certificate-management',
-            'secret-management',
-            'identity-management',
-            'access-management',
-            'audit-logging',
-            'backup',
-            'disaster-recovery',
-            'business-continuity',
-            'incident-response',
-            'vulnerability-management',
-            'patch-management',
-            'configuration-management',
-            'change-management',
-            'release-management',
-            'deployment',
-            'container-orchestration',
-            'service-discovery',
-            'api-management',
-            'content-delivery',
-            'dns',
-            'dhcp',
-            'ntp',
-            'syslog',
-            'monitoring-agent',
-            'logging-agent',
-            'security-agent',
-            'endpoint-protection',
-            'mobile-device-management',
-            'unified-endpoint-management',
-            'email',
-            'chat',
-            'collaboration',
-            'document-management',
-            'knowledge-management',
-            'project-management',
-            'issue-tracking',
-            'version-control',
-            'build-automation',
-            'test-automation',
-            'deployment-automation',
-            'infrastructure-as-code',
-            'configuration-as-code',
-            'policy-as-code',
-            'security-as-code',
-            'compliance-as-code',
-            'governance-as-code',
-            'risk-management',
-            'compliance-management',
-            'audit-management',
-            'incident-management',
-            'problem-management',
-            'change-management',
-            'release-management',
-            'deployment-management',
-            'configuration-management',
-            'asset-management',
-            'license-management',
-            'vendor-management',
-            'contract-management',
-            'service-level-management',
-            'availability-management',
-            'capacity-management',
-            'continuity-management',
-            'security-management',
-            'risk-management',
-            'compliance-management',
-            'audit-management',
-            'incident-management',
-            'problem-management',
-            'change-management',
-            'release-management',
-            'deployment-management',
-            'configuration-management',
-            'asset-management',
-            'license-management',
-            'vendor-management',
-            'contract-management',
-            'service-level-management',
-            'availability-management',
-            'capacity-management',
-            'continuity-management'
-        }
+        return _VALID_ASSET_TYPES
     
     def validate_post_conversion(self, yaml_content: str) -> ValidationResult:
         """
@@ -761,30 +1145,25 @@ class ThreagileValidator:
         Returns:
             ValidationResult: Le résultat de la validation
         """
-        result = self.validate_yaml(yaml_content)
+        result, data = self._load_and_validate(yaml_content, with_data=True)
         if not result.is_valid:
             return result
             
         try:
-            data = yaml.safe_load(yaml_content)
-            errors = []
-            warnings = []
-            details = {}
-            
-            # Validation des noms et formats
-            self._validate_naming_conventions(data, errors, warnings)
-            
-            # Validation des descriptions
-            self._validate_descriptions(data, errors, warnings)
-            
-            # Validation des niveaux de sécurité
-            self._validate_security_levels(data, errors, warnings)
+            errors: List[str] = []
+            warnings: List[str] = []
+            details: Dict[str, Any] = {}
             
-            # Validation de la conformité Threagile
-            self._validate_threagile_compliance(data, errors, warnings)
-            
-            # Validation des relations et dépendances
-            self._validate_relationships(data, errors, warnings)
+            # Validation des noms, descriptions et niveaux de sécurité, en une
+            # passe par collection. La conformité, l'unicité des IDs et les
+            # références ont déjà été validées sans erreur par validate_yaml
+            # sur ces mêmes données : inutile de les parcourir à nouveau.
+            sections = _unpack_sections(data)
+            description = data.get('description', _MISSING)
+            components = sections.components if sections.components is not _MISSING else ()
+            technical_assets = sections.technical_assets if sections.technical_assets is not _MISSING else ()
+            if description is not _MISSING or components or technical_assets:
+                self._validate_post_conversion_rules(description, components, technical_assets, errors, warnings)
             
             # Mise à jour du résultat
             result.errors.extend(errors)
@@ -794,8 +1173,11 @@ class ThreagileValidator:
             
             return result
             
-        except Exception as e:
-            logger.error(f"Erreur lors de la validation post-conversion: {str(e)}")
+        except (AttributeError, KeyError, TypeError, ValueError, re.error) as e:
+            # Données de forme inattendue (valeur non textuelle, niveau non
+            # hachable...) ou motif de nommage invalide dans la configuration ;
+            # toute autre exception révèle un bogue et remonte
+            logger.error("Erreur lors de la validation post-conversion: %s", e)
             return ValidationResult(
                 is_valid=False,
                 errors=[f"Erreur lors de la validation post-conversion: {str(e)}"],
@@ -803,71 +1185,80 @@ class ThreagileValidator:
                 details={}
             )
     
-    def _validate_naming_conventions(self, data: Dict, errors: List[str], warnings: List[str]) -> None:
-        """Valide les conventions de nommage."""
-        # Validation des noms de composants
-        if 'components' in data:
-            for i, component in enumerate(data['components']):
-                if 'name' in component:
-                    if not re.match(self.validation_rules['component_naming'], component['name']):
-                        errors.append(f"Composant {i}: nom invalide '{component['name']}'")
-        
-        # Validation des noms d'assets
-        if 'technical_assets' in data:
-            for i, asset in enumerate(data['technical_assets']):
-                if 'name' in asset:
-                    if not re.match(self.validation_rules['asset_naming'], asset['name']):
-                        errors.append(f"Asset {i}: nom invalide '{asset['name']}'")
-    
-    def _validate_descriptions(self, data: Dict, errors: List[str], warnings: List[str]) -> None:
-        """Valide les descriptions."""
+    def _rule_pattern(self, rule_name: str) -> 're.Pattern[str]':
+        """Retourne l'expression régulière compilée d'une règle de validation."""
+        pattern = self._compiled_rules.get(rule_name)
+        if pattern is None:
+            pattern = re.compile(self.validation_rules[rule_name])
+        return pattern
+    
+    def _validate_post_conversion_rules(self, description: Any, components: Sequence[Dict],
+                                        technical_assets: Sequence[Dict],
+                                        errors: List[str], warnings: List[str]) -> None:
+        """
+        Valide les conventions de nommage, les descriptions et les niveaux de
+        sécurité, en un seul parcours des composants et des assets techniques.
+        
+        Les éléments ayant passé la validation structurelle sont des dict :
+        chaque champ y est lu par un seul get().
+        
+        Args:
+            description: La description principale, ou _MISSING si absente
+            components: Les composants (vide si absents)
+            technical_assets: Les assets techniques (vide si absents)
+            errors: Liste des erreurs à compléter
+            warnings: Liste des avertissements à compléter
+        """
+        errors_append = errors.append
+        warnings_append = warnings.append
+        
         min_length = self.validation_rules['min_description_length']
         max_length = self.validation_rules['max_description_length']
         
         # Validation de la description principale
-        if 'description' in data:
-            desc = data['description']
-            if len(desc) < min_length:
-                warnings.append(f"Description principale trop courte ({len(desc)} caractères)")
-            elif len(desc) > max_length:
-                warnings.append(f"Description principale trop longue ({len(desc)} caractères)")
-        
-        # Validation des descriptions des composants
-        if 'components' in data:
-            for i, component in enumerate(data['components']):
-                if 'description' in component:
-                    desc = component['description']
-                    if len(desc) < min_length:
-                        warnings.append(f"Description du composant {i} trop courte ({len(desc)} caractères)")
-                    elif len(desc) > max_length:
-                        warnings.append(f"Description du composant {i} trop longue ({len(desc)} caractères)")
-    
-    def _validate_security_levels(self, data: Dict, errors: List[str], warnings: List[str]) -> None:
-        """Valide les niveaux de sécurité."""
-        if 'technical_assets' in data:
-            for i, asset in enumerate(data['technical_assets']):
-                for level_type, valid_levels in self.valid_security_levels.items():
-                    if level_type in asset:
-                        if asset[level_type] not in valid_levels:
-                            errors.append(
-                                f"Asset {i}: niveau de {level_type} invalide '{asset[level_type]}'"
-                            )
-    
-    def _validate_relationships(self, data: Dict, errors: List[str], warnings: List[str]) -> None:
-        """Valide les relations entre les éléments."""
-        if 'components' in data and 'technical_assets' in data:
-            # Création des sets d'IDs pour la validation
-            component_ids = {comp['id'] for comp in data['components'] if 'id' in comp}
-            asset_ids = {asset['id'] for asset in data['technical_assets'] if 'id' in asset}
-            
-            # Validation des références dans les composants
-            for i, component in enumerate(data['components']):
-                if 'technical_assets' in component:
-                    for asset_id in component['technical_assets']:
-                        if asset_id not in asset_ids:
-                            errors.append(f"Composant {i}: référence à un asset inexistant: {asset_id}")
+        if description is not _MISSING:
+            length = len(description)
+            if length < min_length:
+                warnings_append(f"Description principale trop courte ({length} caractères)")
+            elif length > max_length:
+                warnings_append(f"Description principale trop longue ({length} caractères)")
+        
+        # Composants : nom et description (rien à préparer si la liste est vide)
+        if components:
+            component_match = self._rule_pattern('component_naming').match
+            for i, component in enumerate(components):
+                get = component.get
+                name = get('name', _MISSING)
+                if name is not _MISSING and not component_match(name):
+                    errors_append(f"Composant {i}: nom invalide '{name}'")
+                
+                component_description = get('description', _MISSING)
+                if component_description is not _MISSING:
+                    length = len(component_description)
+                    if min_length <= length <= max_length:
+                        continue
+                    if length < min_length:
+                        warnings_append(f"Description du composant {i} trop courte ({length} caractères)")
+                    else:
+                        warnings_append(f"Description du composant {i} trop longue ({length} caractères)")
+        
+        # Assets techniques : nom et niveaux de sécurité ; les erreurs de
+        # niveaux suivent celles de nommage, comme lors de passes séparées
+        if technical_assets:
+            asset_match = self._rule_pattern('asset_naming').match
+            security_levels = tuple(self.valid_security_levels.items())
+            level_errors: List[str] = []
+            level_errors_append = level_errors.append
+            for i, asset in enumerate(technical_assets):
+                get = asset.get
+                name = get('name', _MISSING)
+                if name is not _MISSING and not asset_match(name):
+                    errors_append(f"Asset {i}: nom invalide '{name}'")
                 
-                if 'data_assets' in component:
-                    for data_id in component['data_assets']:
-                        if data_id not in asset_ids:
-                            errors.append(f"Composant {i}: référence à un asset de données inexistant: {data_id}") 
\ No newline at end of file
+                for level_type, valid_levels in security_levels:
+                    level = get(level_type, _MISSING)
+                    if level is not _MISSING and level not in valid_levels:
+                        level_errors_append(
+                            f"Asset {i}: niveau de {level_type} invalide '{level}'"
+                        )
+            errors.extend(level_errors)
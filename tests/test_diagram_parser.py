@@ -8,10 +8,11 @@ from src.utils.diagram_parser import DiagramParser, COMPONENT_TYPES, DATA_TYPES,
 class TestDiagramParser(unittest.TestCase):
     """Tests pour la classe DiagramParser"""
 
-    def setUp(self):
-        """Configuration initiale pour les tests"""
+    @classmethod
+    def setUpClass(cls):
+        """Configuration initiale, partagée par tous les tests"""
         # Exemple de diagramme DrawIO minimal
-        self.minimal_drawio = """<?xml version="1.0" encoding="UTF-8"?>
+        cls.minimal_drawio = """<?xml version="1.0" encoding="UTF-8"?>
         <mxfile>
             <diagram>
                 <mxGraphModel>
@@ -33,7 +34,7 @@ class TestDiagramParser(unittest.TestCase):
         </mxfile>"""
 
         # Exemple de diagramme avec des menaces
-        self.threat_drawio = """<?xml version="1.0" encoding="UTF-8"?>
+        cls.threat_drawio = """<?xml version="1.0" encoding="UTF-8"?>
         <mxfile>
             <diagram>
                 <mxGraphModel>
@@ -54,9 +55,13 @@ class TestDiagramParser(unittest.TestCase):
             </diagram>
         </mxfile>"""
 
+        # Parser partagé par les tests qui ne modifient pas son état ; les
+        # tests d'extraction et de conversion créent leur propre instance
+        cls.minimal_parser = DiagramParser(cls.minimal_drawio)
+
     def test_detect_diagram_type(self):
         """Test de la détection du type de diagramme"""
-        parser = DiagramParser(self.minimal_drawio)
+        parser = self.minimal_parser
         self.assertEqual(parser.diagram_type, 'drawio')
 
     def test_extract_cells(self):
@@ -64,11 +69,12 @@ class TestDiagramParser(unittest.TestCase):
         parser = DiagramParser(self.minimal_drawio)
         cells = parser._extract_cells()
         self.assertEqual(len(cells), 4)  # 4 cellules dans le diagramme minimal
-        self.assertTrue(any(cell['id'] == '2' for cell in cells))  # Vérifie la présence de la Web App
+        ids = {cell['id'] for cell in cells}
+        self.assertIn('2', ids)  # Vérifie la présence de la Web App
 
     def test_determine_component_type(self):
         """Test de la détermination du type de composant"""
-        parser = DiagramParser(self.minimal_drawio)
+        parser = self.minimal_parser
         
         # Test avec un style de web application
         web_app_type = parser._determine_component_type('rounded=1;whiteSpace=wrap;html=1;', 'Web App')
@@ -80,7 +86,7 @@ class TestDiagramParser(unittest.TestCase):
 
     def test_extract_data_assets(self):
         """Test de l'extraction des assets de données"""
-        parser = DiagramParser(self.minimal_drawio)
+        parser = self.minimal_parser
         
         # Test avec un composant contenant des données utilisateur
         user_data = parser._extract_data_assets({'value': 'User Profile Database'})
@@ -90,9 +96,20 @@ class TestDiagramParser(unittest.TestCase):
         business_data = parser._extract_data_assets({'value': 'Order Processing System'})
         self.assertTrue(any(asset['sensitivity'] == 'restricted' for asset in business_data))
 
+    def test_data_asset_ids_unique_across_components(self):
+        """Test de l'unicité des IDs d'assets de données entre composants"""
+        parser = self.minimal_parser
+        
+        user_data = parser._extract_data_assets({'id': '2', 'value': 'User Profile'})
+        order_data = parser._extract_data_assets({'id': '3', 'value': 'Order Profile'})
+        
+        user_ids = {asset['id'] for asset in user_data}
+        order_ids = {asset['id'] for asset in order_data}
+        self.assertFalse(user_ids & order_ids)
+
     def test_determine_protocol(self):
         """Test de la détermination du protocole"""
-        parser = DiagramParser(self.minimal_drawio)
+        parser = self.minimal_parser
         
         # Test avec des composants API
         api_protocol = parser._determine_protocol(
@@ -136,8 +153,9 @@ class TestDiagramParser(unittest.TestCase):
         self.assertIn('threats', threagile)
         
         # Vérifie la présence des composants
-        self.assertTrue(any(asset['name'] == 'Web App' for asset in threagile['technical_assets']))
-        self.assertTrue(any(asset['name'] == 'Database' for asset in threagile['technical_assets']))
+        names = {asset['name'] for asset in threagile['technical_assets']}
+        self.assertIn('Web App', names)
+        self.assertIn('Database', names)
         
         # Vérifie la présence des flux
         self.assertTrue(len(threagile['data_flows']) > 0)
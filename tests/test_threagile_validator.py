@@ -0,0 +1,249 @@
+"""
+Tests pour le module threagile_validator.py
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import date
+from collections import OrderedDict, UserDict
+import yaml
+from src.validators.threagile_validator import ThreagileValidator, _compile_field_checker
+
+REQUIRED_FIELDS = [
+    'title', 'description', 'date', 'author', 'components',
+    'data_assets', 'trust_boundaries', 'technical_assets', 'relations'
+]
+
+def valid_document():
+    """Retourne un modèle Threagile valide (nouvelle copie à chaque appel)"""
+    return {
+        'title': 'Modèle de test',
+        'description': 'Description du modèle de test',
+        'date': '2024-01-01',
+        'author': 'Equipe sécurité',
+        'components': [valid_component()],
+        'technical_assets': [{
+            'id': 'srv', 'name': 'web-server', 'type': 'web-server',
+            'description': 'Serveur applicatif', 'usage': 'business', 'owner': 'Equipe',
+            'confidentiality': 'internal', 'integrity': 'critical', 'availability': 'important',
+            'justification_cia_rating': 'n/a', 'multi_tenant': False, 'redundant': True,
+            'custom_developed_parts': True, 'encryption': 'none', 'authentication': 'none',
+            'authorization': 'none', 'justification_authentication': 'n/a',
+            'justification_authorization': 'n/a', 'security_controls': [],
+            'compliance_requirements': [], 'vulnerabilities': [], 'threats': []
+        }],
+        'data_assets': [{
+            'id': 'users', 'name': 'Utilisateurs', 'description': 'Données des utilisateurs',
+            'usage': 'business', 'owner': 'Equipe', 'confidentiality': 'confidential',
+            'integrity': 'critical', 'availability': 'important', 'justification_cia_rating': 'n/a',
+            'storage': 'none', 'format': 'json', 'origin': 'users', 'quantity': 'many',
+            'tags': [], 'security_controls': [], 'compliance_requirements': [],
+            'data_classification': 'confidential', 'retention_period': '1y', 'backup_frequency': 'daily'
+        }],
+        'trust_boundaries': [{
+            'id': 'net', 'name': 'Réseau interne', 'description': "Réseau de l'entreprise",
+            'type': 'network-on-prem', 'components': ['web'], 'technical_assets': ['srv'],
+            'data_assets': ['users'], 'security_controls': [], 'compliance_requirements': []
+        }],
+        'relations': []
+    }
+
+def valid_component(**overrides):
+    """Retourne un composant valide, éventuellement modifié"""
+    component = {
+        'id': 'web', 'name': 'web-app', 'type': 'web-application',
+        'description': 'Application web publique', 'tags': [], 'technical_assets': ['srv'],
+        'data_assets': ['users'], 'trust_boundaries': [], 'security_controls': [],
+        'compliance_requirements': []
+    }
+    component.update(overrides)
+    return component
+
+class TestThreagileValidator(unittest.TestCase):
+    """Tests pour la classe ThreagileValidator"""
+
+    def setUp(self):
+        """Configuration initiale pour les tests"""
+        self.validator = ThreagileValidator()
+
+    def test_missing_field_named_in_a_value(self):
+        """Test d'un champ requis absent dont le nom apparaît dans une valeur"""
+        result = self.validator.validate_yaml("description: title\n")
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.errors, [
+            f"Champ requis manquant: {field}"
+            for field in REQUIRED_FIELDS
+            if field != 'description'
+        ])
+
+    def test_syntax_error_with_missing_fields(self):
+        """Test d'une erreur de syntaxe dans un document incomplet"""
+        result = self.validator.validate_yaml("title: [\n")
+        self.assertFalse(result.is_valid)
+        self.assertEqual(len(result.errors), 1)
+        self.assertTrue(result.errors[0].startswith("Erreur de parsing YAML: "))
+
+    def test_valid_document(self):
+        """Test de validation d'un modèle valide"""
+        result = self.validator.validate_yaml(yaml.safe_dump(valid_document(), allow_unicode=True))
+        self.assertTrue(result.is_valid)
+        self.assertEqual(result.errors, [])
+
+    def test_field_types_exact_dict(self):
+        """Test des types invalides sur un dict complet (chemin rapide)"""
+        component = valid_component(name=1, tags='aucun')
+        errors, _ = self.validator._validate_components([valid_component(), component])
+        self.assertEqual(errors, [
+            "Composant 1: type invalide pour name: attendu str",
+            "Composant 1: type invalide pour tags: attendu list"
+        ])
+
+    def test_missing_fields_exact_dict(self):
+        """Test des champs manquants d'un dict, dans l'ordre du schéma"""
+        component = valid_component(description=5)
+        del component['type'], component['tags']
+        errors, _ = self.validator._validate_components([component])
+        self.assertEqual(errors, [
+            "Composant 0: champ requis manquant: type",
+            "Composant 0: type invalide pour description: attendu str",
+            "Composant 0: champ requis manquant: tags"
+        ])
+
+    def test_field_checks_on_mapping_types(self):
+        """Test du cas général (sous-classe de dict, mapping quelconque)"""
+        component = valid_component(description=5)
+        del component['type']
+        expected = [
+            "Composant 0: champ requis manquant: type",
+            "Composant 0: type invalide pour description: attendu str"
+        ]
+        for mapping_type in (dict, OrderedDict, UserDict):
+            errors, _ = self.validator._validate_components([mapping_type(component)])
+            self.assertEqual(errors, expected, mapping_type.__name__)
+
+    def test_bool_str_list_type_mismatches(self):
+        """Test des types invalides pour des champs bool, str et list"""
+        asset = valid_document()['technical_assets'][0]
+        asset.update(multi_tenant=1, redundant='yes', owner=True, threats='aucune')
+        errors, _ = self.validator._validate_technical_assets([asset])
+        self.assertEqual(errors, [
+            "Asset 0: type invalide pour owner: attendu str",
+            "Asset 0: type invalide pour multi_tenant: attendu bool",
+            "Asset 0: type invalide pour redundant: attendu bool",
+            "Asset 0: type invalide pour threats: attendu list"
+        ])
+
+    def test_percent_in_field_names_and_labels(self):
+        """Test des caractères % dans les noms de champs et les libellés"""
+        check = _compile_field_checker({'taux%': str, '%d': list}, 'Élément %s')
+        for obj in ({'taux%': 1}, UserDict({'taux%': 1})):
+            errors = []
+            check(obj, 3, errors.append)
+            self.assertEqual(errors, [
+                "Élément %s 3: type invalide pour taux%: attendu str",
+                "Élément %s 3: champ requis manquant: %d"
+            ])
+        
+        errors = []
+        _compile_field_checker({'a%b': str})({}, 0, errors.append)
+        self.assertEqual(errors, ["Champ requis manquant: a%b"])
+
+    def test_field_names_without_python_literal(self):
+        """Test de noms de champs dont la repr() n'est pas un littéral Python"""
+        check = _compile_field_checker({date(2020, 1, 1): str, float('inf'): list, float('nan'): str})
+        for obj in ({date(2020, 1, 1): 1}, UserDict({date(2020, 1, 1): 1})):
+            errors = []
+            check(obj, 0, errors.append)
+            self.assertEqual(errors, [
+                "Type invalide pour 2020-01-01: attendu str",
+                "Champ requis manquant: inf",
+                "Champ requis manquant: nan"
+            ])
+
+    def test_duplicate_ids_reported_once(self):
+        """Test d'un ID dupliqué plusieurs fois, signalé une seule fois"""
+        document = valid_document()
+        document['components'] += [valid_component(), valid_component()]
+        result = self.validator.validate_yaml(yaml.safe_dump(document))
+        self.assertEqual(result.errors, ["ID dupliqué trouvé: web"])
+
+    def test_data_asset_references(self):
+        """Test des références des composants vers les assets de données"""
+        document = valid_document()
+        document['components'][0]['data_assets'] = ['users', 'srv', 'inconnu']
+        result = self.validator.validate_yaml(yaml.safe_dump(document))
+        self.assertEqual(result.errors, [
+            "Composant 0: référence à un asset de données inexistant: srv",
+            "Composant 0: référence à un asset de données inexistant: inconnu"
+        ])
+
+    def test_unhashable_data_asset_id(self):
+        """Test d'un ID d'asset de données non hachable, signalé par son seul type"""
+        document = valid_document()
+        bad_asset = dict(document['data_assets'][0], id=['liste'])
+        document['data_assets'].append(bad_asset)
+        result = self.validator.validate_yaml(yaml.safe_dump(document))
+        self.assertEqual(result.errors, [
+            "Asset de données 1: type invalide pour id: attendu str"
+        ])
+
+    def test_post_conversion(self):
+        """Test de la validation post-conversion"""
+        content = yaml.safe_dump(valid_document())
+        result = self.validator.validate_post_conversion(content)
+        self.assertTrue(result.is_valid)
+        self.assertEqual(result.errors, [])
+        
+        document = valid_document()
+        document['components'][0]['name'] = 'Web App'
+        result = self.validator.validate_post_conversion(yaml.safe_dump(document))
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.errors, ["Composant 0: nom invalide 'Web App'"])
+
+    def test_invalid_naming_pattern_in_config(self):
+        """Test d'un motif de nommage invalide dans la configuration"""
+        rules = dict(self.validator.validation_rules, component_naming='[')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = os.path.join(tmp_dir, 'config.json')
+            with open(config_path, 'w', encoding='utf-8') as f:
+                json.dump({'validation_rules': rules}, f)
+            validator = ThreagileValidator(config_path)
+        
+        content = yaml.safe_dump(valid_document())
+        self.assertTrue(validator.validate_yaml(content).is_valid)
+        result = validator.validate_post_conversion(content)
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.errors, [
+            "Erreur lors de la validation post-conversion: unterminated character set at position 0"
+        ])
+
+    def test_cached_result_is_not_shared(self):
+        """Test de l'isolation des résultats renvoyés depuis le cache"""
+        content = yaml.safe_dump(valid_document())
+        first = self.validator.validate_yaml(content)
+        expected = (first.is_valid, list(first.errors), list(first.warnings), dict(first.details))
+        
+        first.is_valid = False
+        first.errors.append("modifié")
+        first.warnings.clear()
+        first.details['modifié'] = True
+        
+        results = [
+            self.validator.validate_yaml(content),
+            self.validator.validate_post_conversion(content)
+        ]
+        # Après un autre document, les données du premier ne sont plus
+        # conservées : elles sont parsées à nouveau
+        self.validator.validate_yaml("title: autre\n")
+        results.append(self.validator.validate_post_conversion(content))
+        
+        for result in results:
+            self.assertEqual(
+                (result.is_valid, result.errors, result.warnings, result.details),
+                expected
+            )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,12 @@
 """
 Tests unitaires pour la conversion XML vers YAML.
 """
+import json
+import os
 import pytest
-from src.utils.validators import validate_xml, validate_yaml, validate_conversion_result
-from src.utils.file_handlers import validate_file_size
+from hashlib import blake2b
+from src.utils.validators import validate_xml, validate_yaml, validate_conversion_result, _stable_id
+from src.utils.file_handlers import validate_file_size, get_files_to_process
 import xmltodict
 import yaml
 
@@ -38,6 +41,15 @@ def test_validate_conversion_result():
     yaml_dict = yaml.safe_load(SAMPLE_YAML)
     assert validate_conversion_result(xml_dict, yaml_dict)
 
+def test_stable_id_uses_canonical_json():
+    """Test de l'identifiant reproductible (texte non ASCII et grands flottants)."""
+    data = {'name': 'Base de données élevée', 'size': 1e20, 'tags': ['é', 2]}
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    assert canonical == b'{"name":"Base de donn\\u00e9es \\u00e9lev\\u00e9e","size":1e+20,"tags":["\\u00e9",2]}'
+    assert _stable_id('temp', data) == f"temp_{blake2b(canonical, digest_size=8).hexdigest()}"
+    # L'ordre des clés n'a pas d'influence
+    assert _stable_id('temp', dict(reversed(list(data.items())))) == _stable_id('temp', data)
+
 def test_validate_file_size(tmp_path):
     """Test de validation de la taille du fichier."""
     # Créer un fichier temporaire
@@ -48,6 +60,33 @@ def test_validate_file_size(tmp_path):
     
     # Créer un fichier trop grand
     large_file = tmp_path / "large.xml"
-    large_file.write_text(SAMPLE_XML * 1000000)  # Répéter le contenu pour créer un gros fichier
+    large_file.write_bytes(b"")
+    os.truncate(large_file, 2 * 1024 * 1024)  # Fichier creux de 2 Mo, sans écrire de données
+    
+    assert not validate_file_size(str(large_file), max_size_mb=1) 
+
+def test_get_files_to_process(tmp_path):
+    """Test de la recherche récursive des fichiers à traiter."""
+    (tmp_path / "sub" / "deep").mkdir(parents=True)
+    (tmp_path / "a.xml").write_text(SAMPLE_XML)
+    (tmp_path / "sub" / "b.xml").write_text(SAMPLE_XML)
+    (tmp_path / "sub" / "deep" / "c.xml").write_text(SAMPLE_XML)
+    (tmp_path / "sub" / "notes.txt").write_text("")
+    
+    files = get_files_to_process(str(tmp_path), ".xml")
+    
+    assert sorted(files) == sorted([
+        str(tmp_path / "a.xml"),
+        str(tmp_path / "sub" / "b.xml"),
+        str(tmp_path / "sub" / "deep" / "c.xml"),
+    ])
+    
+    assert sorted(get_files_to_process(str(tmp_path), ".xml", workers=2)) == sorted(files)
+    assert get_files_to_process(str(tmp_path), "*.txt") == [str(tmp_path / "sub" / "notes.txt")]
+    
+    files = get_files_to_process(str(tmp_path), r"[ab]\.xml$", regex=True)
     
-    assert not validate_file_size(str(large_file), max_size_mb=1) 
\ No newline at end of file
+    assert sorted(files) == sorted([
+        str(tmp_path / "a.xml"),
+        str(tmp_path / "sub" / "b.xml"),
+    ])